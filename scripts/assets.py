@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Pacotes de CSS e JS para publicação (--bundle-assets).
+
+Cada sequência de <link rel="stylesheet"> ou <script src> locais do
+index.html vira um único arquivo minificado com hash no nome
+(styles/bundle.<hash>.css, scripts/bundle.<hash>.js, + .gz/.br), na
+mesma ordem dos arquivos originais. A tag que fica no lugar guarda a
+lista de origens em data-bundle, então o gerador consegue refazer o
+pacote (ou voltar às tags originais, sem a opção) em outra execução. As origens
+são lidas do template (este repositório), então o site de saída não
+precisa ter cópias delas.
+
+Os minificadores são conservadores e rodam em Python puro: o CSS perde
+comentários e espaços ao redor de { } ; , > e depois de ":", o JS perde
+comentários, indentação e espaços que não separam palavras. As quebras de
+linha do JS que podem encerrar um comando são mantidas (inserção
+automática de ponto e vírgula).
+"""
+
+import re
+from html import escape
+from pathlib import Path
+
+from build_cache import LRUCache, sha256_bytes, sha256_file
+from bundles import compressed_variants
+from images import SOURCE_ROOT
+
+HASH_LENGTH = 10
+
+_CSS_TAG_RE = re.compile(r'<link rel="stylesheet" href="([^":?#]+\.css)"(?: data-bundle="([^"]*)")?>')
+_JS_TAG_RE = re.compile(r'<script src="([^":?#]+\.js)"(?: data-bundle="([^"]*)")?></script>')
+
+# ---------------------------------------------------------------------------
+# CSS
+
+# Strings e url() sem aspas passam intactas; comentários viram um espaço
+_CSS_TOKEN_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|\burl\(\s*[^\s"\')][^)]*\))|/\*.*?\*/', re.S | re.I
+)
+_CSS_SPACE_RE = re.compile(r"\s*([{};,>])\s*|:\s+|\s+")
+
+def _squeeze_css(code):
+    def replace(match):
+        if match.group(1):
+            return match.group(1)
+        return ":" if match.group(0).startswith(":") else " "
+    return _CSS_SPACE_RE.sub(replace, code).replace(";}", "}")
+
+def minify_css(css):
+    """Remove comentários e espaços desnecessários (strings intactas)"""
+    parts = []
+    code = []
+    position = 0
+    for match in _CSS_TOKEN_RE.finditer(css):
+        code.append(css[position:match.start()])
+        position = match.end()
+        if match.group(1):
+            parts.extend((_squeeze_css("".join(code)), match.group(1)))
+            code = []
+        else:
+            code.append(" ")
+    code.append(css[position:])
+    parts.append(_squeeze_css("".join(code)))
+    return "".join(parts).strip()
+
+# ---------------------------------------------------------------------------
+# JavaScript
+
+# Depois destes caracteres (ou palavras), "/" começa uma regex, não uma divisão
+_REGEX_PREFIX = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+}
+# Linhas que terminam ou começam assim podem ser unidas sem mudar o ASI
+_JOIN_AFTER = tuple("{;,([=:?&|")
+_JOIN_BEFORE = tuple("}).]:?,")
+
+def _is_word(char):
+    return char.isalnum() or char in "_$." or ord(char) > 127
+
+def _js_tokens(code):
+    """
+    Divide o código em ("code", texto) e ("literal", texto) para strings,
+    template strings e regex; comentários viram espaço (ou quebra de linha).
+    """
+    tokens = []
+    buffer = []
+    i = 0
+    length = len(code)
+    # Chaves abertas dentro de cada ${...} de template ainda não fechado
+    templates = []
+
+    def flush():
+        if buffer:
+            tokens.append(("code", "".join(buffer)))
+            buffer.clear()
+
+    def regex_allowed():
+        previous = "".join(buffer).rstrip()
+        if not previous:
+            return not tokens or tokens[-1][0] == "code"
+        word = re.search(r"[\w$]+$", previous)
+        return previous[-1] in _REGEX_PREFIX or bool(word and word.group(0) in _REGEX_KEYWORDS)
+
+    def template_end(start):
+        """Fim do trecho de template em start: depois de ` ou de ${"""
+        j = start
+        while j < length:
+            if code[j] == "\\":
+                j += 2
+            elif code[j] == "`":
+                return j + 1, False
+            elif code.startswith("${", j):
+                return j + 2, True
+            else:
+                j += 1
+        return length, False
+
+    while i < length:
+        char = code[i]
+        if char in "\"'":
+            flush()
+            j = i + 1
+            while j < length and code[j] != char:
+                j += 2 if code[j] == "\\" else 1
+            tokens.append(("literal", code[i:j + 1]))
+            i = j + 1
+        elif char == "`" or (char == "}" and templates and templates[-1] == 0):
+            flush()
+            if char == "}":
+                templates.pop()
+            end, opened = template_end(i + 1)
+            if opened:
+                templates.append(0)
+            tokens.append(("literal", code[i:end]))
+            i = end
+        elif code.startswith("//", i):
+            end = code.find("\n", i)
+            i = length if end == -1 else end
+        elif code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = length if end == -1 else end + 2
+            buffer.append("\n" if "\n" in code[i:end] else " ")
+            i = end
+        elif char == "/" and regex_allowed():
+            flush()
+            j = i + 1
+            in_class = False
+            while j < length and (code[j] != "/" or in_class):
+                if code[j] == "\\":
+                    j += 1
+                elif code[j] == "[":
+                    in_class = True
+                elif code[j] == "]":
+                    in_class = False
+                j += 1
+            j += 1
+            while j < length and code[j].isalpha():
+                j += 1
+            tokens.append(("literal", code[i:j]))
+            i = j
+        else:
+            if templates and char in "{}":
+                templates[-1] += 1 if char == "{" else -1
+            buffer.append(char)
+            i += 1
+    flush()
+    return tokens
+
+def _squeeze_js(code):
+    """Espaços de um trecho de código: só ficam os que separam palavras, + + e - -"""
+    out = []
+    pending = False
+    for char in code:
+        if char in " \t\r\f\v":
+            pending = True
+            continue
+        if pending and out:
+            previous = out[-1]
+            if (
+                (_is_word(previous) and _is_word(char))
+                or (previous in "+-" and char in "+-")
+                or "/" in (previous, char)
+            ):
+                out.append(" ")
+        pending = False
+        out.append(char)
+    if pending and out:
+        out.append(" ")
+    return "".join(out)
+
+def _js_lines(js):
+    """Linhas como listas de (tipo, texto); "cont" continua um literal multilinha"""
+    lines = [[]]
+    for kind, text in _js_tokens(js):
+        pieces = text.split("\n")
+        lines[-1].append((kind, pieces[0]))
+        for piece in pieces[1:]:
+            lines.append([("cont" if kind == "literal" else "code", piece)])
+    return lines
+
+def minify_js(js):
+    """Remove comentários, indentação e linhas vazias (literais intactos)"""
+    output = []
+    for segments in _js_lines(js):
+        if not segments:
+            continue
+        protected = segments[0][0] == "cont"
+        rendered = []
+        for kind, text in segments:
+            if kind != "code":
+                if rendered and rendered[-1].endswith(" ") and not rendered[-1].endswith("/ "):
+                    rendered[-1] = rendered[-1].rstrip()
+                rendered.append(text)
+                continue
+            squeezed = _squeeze_js(text)
+            if rendered and rendered[-1].endswith("/") and squeezed.startswith("/"):
+                squeezed = " " + squeezed
+            rendered.append(squeezed)
+        if segments[0][0] == "code":
+            rendered[0] = rendered[0].lstrip()
+        if segments[-1][0] == "code":
+            rendered[-1] = rendered[-1].rstrip()
+        line = "".join(rendered)
+        if protected:
+            output.append(line)
+        elif not line:
+            continue
+        elif output and (output[-1].endswith(_JOIN_AFTER) or line.startswith(_JOIN_BEFORE)):
+            output[-1] += line
+        else:
+            output.append(line)
+    return "\n".join(output)
+
+# ---------------------------------------------------------------------------
+# Pacotes
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+SEPARATORS = {".css": "\n", ".js": ";\n"}
+
+# Pacotes já minificados neste processo, pelo hash das origens (modo multi-tenant)
+_MINIFIED = LRUCache(maxsize=32)
+
+def _minifier_key():
+    """Muda quando este arquivo muda: invalida pacotes antigos"""
+    return sha256_file(Path(__file__))[:HASH_LENGTH]
+
+def _tag_runs(html):
+    """
+    Sequências de tags de CSS/JS locais em linhas consecutivas:
+    [(índice da primeira linha, quantidade, extensão, origens, href atual)].
+    """
+    runs = []
+    lines = html.split("\n")
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        for extension, tag_re in ((".css", _CSS_TAG_RE), (".js", _JS_TAG_RE)):
+            match = tag_re.fullmatch(stripped)
+            if not match:
+                continue
+            sources = match.group(2).split() if match.group(2) is not None else [match.group(1)]
+            bundled = match.group(1) if match.group(2) is not None else None
+            previous = runs[-1] if runs else None
+            if previous and previous[2] == extension and previous[0] + previous[1] == index:
+                previous[1] += 1
+                previous[3].extend(sources)
+                previous[4].append(bundled)
+            else:
+                runs.append([index, 1, extension, sources, [bundled]])
+    return lines, runs
+
+def _tag(extension, href, sources=None):
+    attribute = f' data-bundle="{escape(" ".join(sources))}"' if sources else ""
+    if extension == ".css":
+        return f'<link rel="stylesheet" href="{escape(href)}"{attribute}>'
+    return f'<script src="{escape(href)}"{attribute}></script>'
+
+def _remove_bundle(manifest, relative_path):
+    for stale in (relative_path, relative_path + ".gz", relative_path + ".br"):
+        manifest.remove(stale)
+
+def _source_digest(sources):
+    parts = [_minifier_key()] + [f"{source}:{sha256_file(SOURCE_ROOT / source)}" for source in sources]
+    return sha256_bytes("\n".join(parts).encode("utf-8"))
+
+def _bundle_key(sources):
+    return f"bundle:{' '.join(sources)}"
+
+def _bundle(manifest, extension, sources):
+    """Gera (ou reaproveita) o pacote das origens; retorna o caminho dele"""
+    digest = _source_digest(sources)
+    # A entrada guarda o hash das origens e o pacote gerado a partir delas
+    previous_digest, _, previous = manifest.inputs.get(_bundle_key(sources), "").partition(" ")
+    if previous and previous_digest == digest and manifest.is_fresh(previous):
+        manifest.skipped.append(previous)
+        return previous
+
+    payload = _MINIFIED.get(digest)
+    if payload is None:
+        minify = MINIFIERS[extension]
+        parts = [minify((SOURCE_ROOT / source).read_text(encoding="utf-8")) for source in sources]
+        payload = _MINIFIED.put(digest, (SEPARATORS[extension].join(parts) + "\n").encode("utf-8"))
+    directory = sources[0].rsplit("/", 1)[0] + "/" if "/" in sources[0] else ""
+    relative_path = f"{directory}bundle.{sha256_bytes(payload)[:HASH_LENGTH]}{extension}"
+
+    manifest.write(relative_path, payload)
+    for suffix, compressed in compressed_variants(payload).items():
+        manifest.write(relative_path + suffix, compressed)
+    if previous and previous != relative_path:
+        _remove_bundle(manifest, previous)
+    manifest.inputs[_bundle_key(sources)] = f"{digest} {relative_path}"
+    return relative_path
+
+def _bundleable(extension, sources):
+    # Caminhos relativos de url() no CSS só continuam válidos no mesmo diretório
+    directories = {source.rsplit("/", 1)[0] if "/" in source else "" for source in sources}
+    if extension == ".css" and len(directories) > 1:
+        return False
+    return all((SOURCE_ROOT / source).is_file() for source in sources)
+
+def assets_stale(manifest):
+    """Alguma origem de um pacote gerado mudou desde a última execução?"""
+    for name, value in manifest.inputs.items():
+        if not name.startswith("bundle:"):
+            continue
+        try:
+            if value.partition(" ")[0] != _source_digest(name.partition(":")[2].split()):
+                return True
+        except OSError:
+            return True
+    return False
+
+def update_assets(manifest, enabled, html):
+    """
+    Com enabled, troca cada sequência de tags de CSS/JS do html pelo pacote
+    delas; sem, volta às tags originais e apaga os pacotes gerados antes.
+    Retorna o html resultante (quem chama decide onde gravá-lo).
+    """
+    lines, runs = _tag_runs(html)
+    used = set()
+
+    # De trás para frente, para os índices das linhas continuarem válidos
+    for index, count, extension, sources, bundled in reversed(runs):
+        indent = lines[index][:len(lines[index]) - len(lines[index].lstrip())]
+        if enabled and _bundleable(extension, sources):
+            used.add(_bundle_key(sources))
+            replacement = [indent + _tag(extension, _bundle(manifest, extension, sources), sources)]
+        elif any(bundled):
+            replacement = [indent + _tag(extension, source) for source in sources]
+        else:
+            continue
+        lines[index:index + count] = replacement
+
+    # Pacotes de execuções anteriores que não são mais usados (menos os que
+    # o próprio html já referencia)
+    referenced = {href for run in runs for href in run[4] if href}
+    for name in [name for name in manifest.inputs if name.startswith("bundle:") and name not in used]:
+        previous = manifest.inputs.pop(name).partition(" ")[2]
+        if previous and previous not in referenced:
+            _remove_bundle(manifest, previous)
+    return "\n".join(lines)
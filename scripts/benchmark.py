@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Benchmark do gerador com CVs sintéticos.
+
+Gera PDFs com tags (no layout que parse_cv_blocks espera) com 1 a 10.000
+entradas de experiência e de projeto, e conjuntos de 2 a 50 idiomas. Cada
+etapa (extract_cv_info, update_translations, update_projects e
+save_cv_data) roda em um processo próprio, para que o pico de RSS seja só
+dela; em save_cv_data_cached o build completo que aquece o cache roda em
+outro processo, antes. O resultado (tempo, pico de RSS e bytes gravados) sai em JSON.
+
+    python3 scripts/benchmark.py -o bench.json
+    python3 scripts/benchmark.py --entries 1000 --locales 10 --baseline bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+ENTRIES = (1, 100, 1000, 10000)
+LOCALES = (2, 10, 50)
+STAGES = ("extract_cv_info", "update_translations", "update_projects", "save_cv_data", "save_cv_data_cached")
+BLOCKS_PER_PAGE = 400
+# Diferenças abaixo disso são ruído, não regressão
+MIN_REGRESSION_S = 0.005
+
+# Fonte de 1 byte: Latin-1, exceto o código 0x97, que é o travessão
+_TO_UNICODE = (
+    b"begincmap\n1 begincodespacerange <00> <FF> endcodespacerange\n"
+    b"1 beginbfchar <97> <2014> endbfchar\n"
+    b"2 beginbfrange <20> <96> <0020> <98> <FF> <0098> endbfrange\nendcmap"
+)
+
+def _pdf_string(text):
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").replace("—", "\x97")
+    return b"(" + escaped.encode("latin-1", "replace") + b")"
+
+def synthetic_blocks(entries):
+    """Blocos (tag, texto) de um CV com `entries` experiências e projetos"""
+    yield "H1", f"Synthetic Person {entries}"
+    yield "P", "Email"
+    yield "P", f"person{entries}@example.com"
+    yield "P", "Rua Exemplo, Natal, RN, Brasil"
+    yield "H1", "EXPERIENCE"
+    for i in range(entries):
+        yield "H2", f"Company {i}, City {i % 50} — Senior Developer {i}"
+        yield "H3", f"jan {2000 + i % 25} - present"
+        yield "P", f"Built feature {i} for client {i % 97}. Improved performance by {i % 60}%. Led a team of {i % 9 + 2}."
+        yield "P", "Main tech: React, TypeScript and Node.js"
+    yield "H1", "PROJECTS"
+    for i in range(entries):
+        yield "H2", f"Project {i}"
+        yield "P", f"Platform number {i} for managing synthetic workloads."
+        yield "P", "Tech stack: React, Node.js, PostgreSQL"
+    yield "H1", "SKILLS"
+    yield "P", "React, TypeScript, Node.js, Docker, Git"
+    yield "H1", "LANGUAGES"
+    yield "P", "Português (nativo), Inglês (avançado)"
+
+def write_synthetic_pdf(path, entries):
+    """PDF com tags, sem compressão, com BLOCKS_PER_PAGE blocos por página"""
+    blocks = list(synthetic_blocks(entries))
+    pages = [blocks[i:i + BLOCKS_PER_PAGE] for i in range(0, len(blocks), BLOCKS_PER_PAGE)]
+
+    # 1: catálogo, 2: árvore de páginas, 3: fonte, 4: ToUnicode; depois (página, conteúdo)
+    objects = {
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /ToUnicode 4 0 R >>",
+        4: b"<< /Length %d >>\nstream\n%s\nendstream" % (len(_TO_UNICODE), _TO_UNICODE),
+    }
+    kids = []
+    for index, page_blocks in enumerate(pages):
+        page_num, content_num = 5 + 2 * index, 6 + 2 * index
+        lines = [b"BT /F1 10 Tf 50 800 Td"]
+        for mcid, (tag, text) in enumerate(page_blocks):
+            lines.append(b"/%s <</MCID %d>> BDC %s Tj 0 -12 Td EMC" % (tag.encode(), mcid, _pdf_string(text)))
+        lines.append(b"ET")
+        content = b"\n".join(lines)
+        objects[content_num] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        objects[page_num] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_num
+        )
+        kids.append(b"%d 0 R" % page_num)
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R /MarkInfo << /Marked true >> >>"
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.7\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, objects[num])
+    xref_at = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for num in range(1, size):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_at)
+    Path(path).write_bytes(bytes(out))
+
+def write_synthetic_locales(locales_dir, count):
+    """Template e catálogos reais (en, pt) mais cópias do inglês até `count` idiomas"""
+    source = SCRIPTS_DIR / "locales"
+    locales_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(source / "template.json", locales_dir / "template.json")
+    with open(source / "en.json", encoding="utf-8") as f:
+        english = json.load(f)
+    for locale in ("en", "pt")[:count]:
+        shutil.copy(source / f"{locale}.json", locales_dir / f"{locale}.json")
+    for index in range(2, count):
+        catalog = dict(english, locale={"name": f"Locale {index}", "htmlLang": f"x-l{index:02d}"})
+        with open(locales_dir / f"l{index:02d}.json", "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False)
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def run_stage(stage, pdf_path, output_root):
+    """Executa uma etapa neste processo; retorna a medição dela"""
+    from build_cache import BuildManifest
+    from extract_cv import extract_cv_info, save_cv_data, update_projects, update_translations
+
+    manifest = None
+    if stage == "extract_cv_info":
+        started = time.perf_counter()
+        extract_cv_info(pdf_path)
+    elif stage in ("update_translations", "update_projects"):
+        cv_data = extract_cv_info(pdf_path)
+        manifest = BuildManifest(output_root)
+        update = update_translations if stage == "update_translations" else update_projects
+        started = time.perf_counter()
+        update(cv_data, output_root, manifest)
+    else:
+        started = time.perf_counter()
+        manifest = save_cv_data(pdf_path, output_root, verbose=False, force=stage == "save_cv_data")
+    wall = time.perf_counter() - started
+    return {
+        "wall_s": round(wall, 6),
+        "peak_rss_kb": _peak_rss_kb(),
+        "bytes_written": manifest.bytes_written if manifest else 0,
+    }
+
+def _measure(stage, pdf_path, locales_dir, work_dir):
+    """
+    Roda a etapa em um processo novo, com saída em uma pasta limpa. Para
+    save_cv_data_cached, um processo anterior faz o build completo e o
+    processo medido só encontra o cache.
+    """
+    output_root = work_dir / f"out-{stage}"
+    shutil.rmtree(output_root, ignore_errors=True)
+    env = dict(os.environ, CV_LOCALES_DIR=str(locales_dir))
+
+    def run(run_stage):
+        result = subprocess.run(
+            [sys.executable, __file__, "--run-stage", run_stage, str(pdf_path), str(output_root)],
+            env=env, capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout.splitlines()[-1])
+
+    if stage == "save_cv_data_cached":
+        run("save_cv_data")
+    return run(stage)
+
+def run_benchmarks(entries, locales, stages=STAGES, repeat=1):
+    """Mede todas as combinações; cada medição é a mediana de `repeat` execuções"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="cv-bench-") as tmp:
+        tmp = Path(tmp)
+        for entry_count in entries:
+            pdf_path = tmp / f"cv-{entry_count}.pdf"
+            write_synthetic_pdf(pdf_path, entry_count)
+            for locale_count in locales:
+                locales_dir = tmp / f"locales-{locale_count}"
+                if not locales_dir.exists():
+                    write_synthetic_locales(locales_dir, locale_count)
+                for stage in stages:
+                    runs = [_measure(stage, pdf_path, locales_dir, tmp) for _ in range(repeat)]
+                    result = {
+                        "stage": stage,
+                        "entries": entry_count,
+                        "locales": locale_count,
+                        "pdf_bytes": pdf_path.stat().st_size,
+                        "wall_s": statistics.median(run["wall_s"] for run in runs),
+                        "peak_rss_kb": max(run["peak_rss_kb"] for run in runs),
+                        "bytes_written": runs[-1]["bytes_written"],
+                    }
+                    print(
+                        f"   {stage:<22} {entry_count:>6} entradas {locale_count:>3} idiomas "
+                        f"{result['wall_s'] * 1000:>10.1f} ms {result['peak_rss_kb'] / 1024:>8.1f} MB "
+                        f"{result['bytes_written']:>12} bytes",
+                        file=sys.stderr,
+                    )
+                    results.append(result)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(report, baseline, tolerance):
+    """Medições mais lentas que a baseline além da tolerância (ex.: 0.2 = 20%)"""
+    previous = {
+        (item["stage"], item["entries"], item["locales"]): item
+        for item in baseline.get("results", [])
+    }
+    regressions = []
+    for item in report["results"]:
+        old = previous.get((item["stage"], item["entries"], item["locales"]))
+        if (
+            old
+            and item["wall_s"] > old["wall_s"] * (1 + tolerance)
+            and item["wall_s"] - old["wall_s"] > MIN_REGRESSION_S
+        ):
+            regressions.append(
+                f"{item['stage']} ({item['entries']} entradas, {item['locales']} idiomas): "
+                f"{old['wall_s'] * 1000:.1f} ms -> {item['wall_s'] * 1000:.1f} ms"
+            )
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do gerador com CVs sintéticos")
+    parser.add_argument("--entries", type=int, nargs="+", default=list(ENTRIES),
+                        help="quantidade de experiências e de projetos por CV")
+    parser.add_argument("--locales", type=int, nargs="+", default=list(LOCALES),
+                        help="quantidade de idiomas")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=1, help="execuções por medição (usa a mediana)")
+    parser.add_argument("-o", "--output", help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="aumento de tempo tolerado em relação à baseline (padrão: 0.2)")
+    parser.add_argument("--run-stage", nargs=3, metavar=("STAGE", "PDF", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_stage:
+        stage, pdf_path, output_root = args.run_stage
+        print(json.dumps(run_stage(stage, pdf_path, output_root)))
+        return 0
+
+    print(f"🚀 Benchmark: {args.entries} entradas x {args.locales} idiomas", file=sys.stderr)
+    report = run_benchmarks(args.entries, args.locales, args.stages, args.repeat)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+        print(f"📁 Resultados em {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"   ❌ Regressão: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("✅ Sem regressões em relação à baseline", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
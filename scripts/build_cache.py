@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Cache incremental dos arquivos gerados a partir do CV.
+
+Cada site de saída guarda um manifesto (.build-manifest.json) com o hash da
+entrada e de cada arquivo gerado. Arquivos cujo conteúdo não mudou não são
+regravados, preservando o mtime/ETag para o cache HTTP e evitando deploys
+desnecessários no GitHub Pages.
+
+No modo multi-tenant, os sites compartilham um ContentStore: cada arquivo
+gerado é gravado uma vez, pelo hash, e os sites recebem hard links para
+ele.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import stat
+from collections import OrderedDict
+from pathlib import Path
+
+from dependency_graph import is_affected
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_file(path, chunk_size=1 << 20):
+    """Hash de um arquivo lido em blocos (não carrega o arquivo inteiro)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def atomic_write_bytes(path, data):
+    """
+    Grava em um arquivo temporário na mesma pasta e renomeia por cima do
+    destino, para que o servidor nunca sirva um arquivo pela metade.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _temp_path(path)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def _temp_path(path, kind="tmp"):
+    return path.with_name(f".{path.name}.{os.getpid()}.{kind}")
+
+# Erros de os.link que indicam um sistema de arquivos sem hard links
+_NO_HARD_LINKS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+class LRUCache:
+    """
+    Memo limitado a maxsize entradas (as usadas há mais tempo saem). Para
+    memos por hash de conteúdo que vivem o processo inteiro, como no modo
+    multi-tenant.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return value
+
+class BuildManifest:
+    """Manifesto de hashes de entrada e saída de um site gerado"""
+
+    def __init__(self, root, data=None):
+        self.root = Path(root)
+        data = data if data and data.get("version") == MANIFEST_VERSION else {}
+        self.input_key = data.get("input")
+        self.generator_key = data.get("generator")
+        self.outputs = data.get("outputs", {})
+        # Hashes de entradas auxiliares (templates) por nome
+        self.inputs = data.get("inputs", {})
+        # Caminhos de cv_data lidos por cada arquivo gerado
+        self.dependencies = {
+            relative: {tuple(path) for path in paths}
+            for relative, paths in data.get("dependencies", {}).items()
+        }
+        self.written = []
+        self.skipped = []
+        self.removed = []
+        self.bytes_written = 0
+        # ContentStore compartilhado entre sites (modo multi-tenant)
+        self.store = None
+
+    @classmethod
+    def load(cls, root):
+        path = Path(root) / MANIFEST_NAME
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(root, json.load(f))
+        except (OSError, ValueError):
+            return cls(root)
+
+    def save(self):
+        data = {
+            "version": MANIFEST_VERSION,
+            "input": self.input_key,
+            "generator": self.generator_key,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+            "dependencies": {
+                relative: sorted((list(path) for path in paths), key=str)
+                for relative, paths in self.dependencies.items()
+            },
+        }
+        payload = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+        atomic_write_bytes(self.root / MANIFEST_NAME, payload)
+
+    def is_fresh(self, relative_path):
+        """O arquivo em disco ainda é o que o manifesto registrou?"""
+        entry = self.outputs.get(relative_path)
+        path = self.root / relative_path
+        if not entry:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        return sha256_file(path) == entry["sha256"]
+
+    def is_up_to_date(self, input_key, generator_key):
+        """Mesma entrada, mesmo gerador e todos os arquivos gerados intactos"""
+        return (
+            self.input_key == input_key
+            and self.generator_key == generator_key
+            and bool(self.outputs)
+            and all(self.is_fresh(relative) for relative in self.outputs)
+        )
+
+    def track_input(self, name, digest):
+        """Registra o hash de uma entrada; retorna True se mudou"""
+        changed = self.inputs.get(name) != digest
+        self.inputs[name] = digest
+        return changed
+
+    def needs_render(self, relative_path, changed):
+        """
+        O arquivo precisa ser renderizado de novo? Sim se não há diff
+        (changed é None), se o arquivo sumiu/foi editado, se não há
+        dependências registradas ou se alguma delas mudou.
+        """
+        if changed is None or relative_path not in self.dependencies:
+            return True
+        if not self.is_fresh(relative_path):
+            return True
+        return is_affected(self.dependencies[relative_path], changed)
+
+    def write(self, relative_path, payload):
+        """
+        Grava payload (bytes) em root/relative_path somente se o conteúdo
+        mudou. Retorna True quando o arquivo foi regravado.
+        """
+        digest = sha256_bytes(payload)
+        entry = self.outputs.get(relative_path)
+        path = self.root / relative_path
+        if entry and entry["sha256"] == digest and self.is_fresh(relative_path):
+            self.skipped.append(relative_path)
+            return False
+        if not entry and path.is_file() and sha256_file(path) == digest:
+            # Arquivo idêntico gerado antes do manifesto existir
+            self._record(relative_path, digest)
+            self.skipped.append(relative_path)
+            return False
+
+        if self.store is not None:
+            self.store.link(self.store.put(digest, payload), path)
+        else:
+            atomic_write_bytes(path, payload)
+        self._record(relative_path, digest)
+        self.written.append(relative_path)
+        self.bytes_written += len(payload)
+        return True
+
+    def write_stream(self, relative_path, chunks):
+        """
+        Como write, mas recebe o conteúdo em partes (bytes), gravadas em um
+        arquivo temporário enquanto o hash é calculado; o conteúdo nunca
+        fica inteiro na memória. Se o hash bate com o arquivo atual, o
+        temporário é descartado.
+        """
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _temp_path(path)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = digest.hexdigest()
+            entry = self.outputs.get(relative_path)
+            if entry and entry["sha256"] == digest and self.is_fresh(relative_path):
+                self.skipped.append(relative_path)
+                return False
+            if not entry and path.is_file() and sha256_file(path) == digest:
+                self._record(relative_path, digest)
+                self.skipped.append(relative_path)
+                return False
+            if self.store is not None:
+                self.store.link(self.store.adopt(tmp, digest), path)
+            else:
+                os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+        self._record(relative_path, digest)
+        self.written.append(relative_path)
+        self.bytes_written += size
+        return True
+
+    def remove(self, relative_path):
+        """Apaga um arquivo gerado que deixou de existir na saída"""
+        path = self.root / relative_path
+        if path.is_file():
+            path.unlink()
+            self.removed.append(relative_path)
+        self.outputs.pop(relative_path, None)
+        self.dependencies.pop(relative_path, None)
+
+    def _record(self, relative_path, digest):
+        stat = (self.root / relative_path).stat()
+        self.outputs[relative_path] = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+class ContentStore:
+    """
+    Arquivos endereçados pelo sha256 (<root>/ab/cdef...), somente leitura,
+    compartilhados por hard link entre vários sites. Conteúdo repetido
+    ocupa o disco uma única vez.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, digest):
+        return self.root / digest[:2] / digest[2:]
+
+    def _seal(self, stored):
+        # Somente leitura: editar um site não pode alterar os outros
+        os.chmod(stored, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        return stored
+
+    def put(self, digest, payload):
+        """Guarda payload se o hash ainda não existe; retorna o caminho"""
+        stored = self.path(digest)
+        if not stored.is_file():
+            atomic_write_bytes(stored, payload)
+            self._seal(stored)
+        return stored
+
+    def adopt(self, tmp, digest):
+        """Como put, mas move um arquivo temporário já gravado"""
+        stored = self.path(digest)
+        if not stored.is_file():
+            stored.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, stored)
+            self._seal(stored)
+        return stored
+
+    def link(self, stored, path):
+        """Aponta path para o arquivo guardado (cópia se não há hard links)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.is_file() and os.path.samefile(stored, path):
+            return
+        # Nome próprio: o temporário de write_stream ainda existe quando o
+        # conteúdo já estava no store
+        tmp = _temp_path(path, "link")
+        try:
+            if tmp.exists():
+                tmp.unlink()
+            os.link(stored, tmp)
+        except OSError as error:
+            if error.errno not in _NO_HARD_LINKS:
+                raise
+            atomic_write_bytes(path, stored.read_bytes())
+            return
+        try:
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def usage(self):
+        """(arquivos, bytes) guardados"""
+        files = [path for path in self.root.glob("*/*") if path.is_file()]
+        return len(files), sum(path.stat().st_size for path in files)
+
+    def prune(self):
+        """Apaga o que nenhum site usa mais (só o link do store); retorna quantos"""
+        removed = 0
+        for path in self.root.glob("*/*"):
+            if path.is_file() and path.stat().st_nlink == 1:
+                path.unlink()
+                removed += 1
+        return removed
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Pacotes de idioma pré-comprimidos.
+
+Para cada idioma junta i18n/<lang>.json e content/projects.<lang>.json em
+um único JSON minificado com hash no nome (i18n/bundle.<lang>.<hash>.json),
+acompanhado de .gz e, se o módulo brotli estiver instalado, .br. O mapa
+idioma -> arquivo vai para i18n/bundles.json e é embutido nas páginas,
+para que o i18n.js baixe o idioma atual em uma única requisição.
+"""
+
+import gzip
+import json
+import re
+from functools import lru_cache
+
+from build_cache import sha256_bytes
+
+try:
+    import brotli
+except ImportError:  # opcional: sem ele só geramos .gz
+    brotli = None
+
+BUNDLE_MAP = "i18n/bundles.json"
+HASH_LENGTH = 10
+
+_INLINE_MAP_RE = re.compile(
+    r'(<script id="i18n-bundles" type="application/json">)(.*?)(</script>)', re.S
+)
+
+def minify_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@lru_cache(maxsize=256)
+def compressed_variants(payload):
+    """
+    Sufixo -> conteúdo comprimido (gzip determinístico, brotli se
+    disponível). Memoizado: no modo multi-tenant o mesmo arquivo de vários
+    sites é comprimido uma vez por processo. Não altere o dict retornado.
+    """
+    variants = {".gz": gzip.compress(payload, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(payload, quality=11)
+    return variants
+
+def read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def update_bundles(manifest, locales):
+    """
+    Regera o pacote dos idiomas cujas traduções ou projetos foram
+    regravados nesta execução (ou cujo pacote sumiu). Pacotes antigos do
+    mesmo idioma são removidos.
+    """
+    root = manifest.root
+    bundle_map = read_json(root / BUNDLE_MAP) or {}
+    changed = False
+
+    for locale in locales:
+        sources = (f"i18n/{locale}.json", f"content/projects.{locale}.json")
+        previous = bundle_map.get(locale)
+        if (
+            previous
+            and manifest.is_fresh(previous)
+            and not any(source in manifest.written for source in sources)
+        ):
+            manifest.skipped.append(previous)
+            continue
+
+        translations, projects = (read_json(root / source) for source in sources)
+        if translations is None or projects is None:
+            continue
+        payload = minify_json({"translations": translations, "projects": projects})
+        relative_path = f"i18n/bundle.{locale}.{sha256_bytes(payload)[:HASH_LENGTH]}.json"
+
+        manifest.write(relative_path, payload)
+        for suffix, compressed in compressed_variants(payload).items():
+            manifest.write(relative_path + suffix, compressed)
+        if previous and previous != relative_path:
+            for stale in (previous, previous + ".gz", previous + ".br"):
+                manifest.remove(stale)
+        bundle_map[locale] = relative_path
+        changed = True
+
+    manifest.write(BUNDLE_MAP, minify_json(bundle_map))
+    return bundle_map
+
+def inline_bundle_map(html, bundle_map):
+    """Embute o mapa no <script id="i18n-bundles"> do html, se existir"""
+    map_json = minify_json(bundle_map).decode("utf-8")
+    return _INLINE_MAP_RE.sub(lambda m: m.group(1) + map_json + m.group(3), html)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Modelo tipado de cv_data.
+
+Cada seção do CV vira um registro dataclass com __slots__ (sem __dict__
+por instância, o que pesa menos no modo batch). CVData.from_dict valida o
+dicionário inteiro em uma única passada e junta todos os erros em um
+CVValidationError, antes de qualquer arquivo ser gravado. Os geradores
+leem os registros por atributo (cv_data.experience[0].highlights).
+"""
+
+from collections.abc import Mapping
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from functools import lru_cache
+from typing import get_args, get_origin, get_type_hints
+
+class CVValidationError(ValueError):
+    """cv_data fora do formato esperado; errors lista cada problema"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} erro(s) em cv_data: " + "; ".join(errors))
+
+    def __reduce__(self):
+        # Volta do processo do pool (modo batch) com a lista de erros intacta
+        return CVValidationError, (self.errors,)
+
+@dataclass(slots=True)
+class PersonalInfo:
+    name: str
+    headline: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    summary: str = ""
+    website: str = ""
+
+@dataclass(slots=True)
+class Experience:
+    company: str
+    position: str
+    period: str = ""
+    location: str = ""
+    description: str = ""
+    technologies: list[str] = field(default_factory=list)
+    highlights: list[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class Education:
+    institution: str
+    degree: str = ""
+    period: str = ""
+    description: str = ""
+
+@dataclass(slots=True)
+class Project:
+    id: str
+    title: str
+    description: str = ""
+    technologies: list[str] = field(default_factory=list)
+    images: list[str] = field(default_factory=list)
+    liveUrl: str = "#"
+    repoUrl: str = "#"
+    featured: bool = False
+
+@dataclass(slots=True)
+class Award:
+    """Prêmios e destaques; certificações têm o mesmo formato"""
+    name: str
+    issuer: str = ""
+    date: str = ""
+    description: str = ""
+
+@dataclass(slots=True)
+class Language:
+    name: str
+    level: str = ""
+
+@dataclass(slots=True)
+class CVData:
+    personal_info: PersonalInfo
+    experience: list[Experience] = field(default_factory=list)
+    education: list[Education] = field(default_factory=list)
+    certifications: list[Award] = field(default_factory=list)
+    skills: dict[str, list[str]] = field(default_factory=dict)
+    projects: list[Project] = field(default_factory=list)
+    awards: list[Award] = field(default_factory=list)
+    languages: list[Language] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Valida e converte cv_data; levanta CVValidationError com todos os erros"""
+        errors = []
+        cv_data = _convert(data, cls, "cv_data", errors)
+        if cv_data is not None:
+            seen = set()
+            for index, project in enumerate(cv_data.projects):
+                if project.id in seen:
+                    errors.append(f"cv_data.projects.{index}.id: id duplicado {project.id!r}")
+                seen.add(project.id)
+        if errors:
+            raise CVValidationError(errors)
+        return cv_data
+
+    def to_dict(self):
+        """Dicionário no formato de cv_data.json"""
+        return asdict(self)
+
+@lru_cache(maxsize=None)
+def _schema(cls):
+    """(nome, tipo, obrigatório) de cada campo, calculado uma vez por classe"""
+    hints = get_type_hints(cls)
+    return tuple(
+        (f.name, hints[f.name], f.default is MISSING and f.default_factory is MISSING)
+        for f in fields(cls)
+    )
+
+def _convert(value, kind, path, errors):
+    """Confere value contra kind e devolve o valor convertido (None se inválido)"""
+    origin = get_origin(kind)
+    if origin is list:
+        if not isinstance(value, list):
+            errors.append(f"{path}: esperado lista, encontrado {type(value).__name__}")
+            return None
+        (item_kind,) = get_args(kind)
+        items = [_convert(item, item_kind, f"{path}.{index}", errors) for index, item in enumerate(value)]
+        return [item for item in items if item is not None]
+    if origin is dict:
+        if not isinstance(value, dict):
+            errors.append(f"{path}: esperado objeto, encontrado {type(value).__name__}")
+            return None
+        _, value_kind = get_args(kind)
+        return {key: _convert(item, value_kind, f"{path}.{key}", errors) for key, item in value.items()}
+    if kind in (str, bool):
+        if not isinstance(value, kind):
+            errors.append(f"{path}: esperado {kind.__name__}, encontrado {type(value).__name__}")
+            return None
+        return value
+
+    if not isinstance(value, dict):
+        errors.append(f"{path}: esperado objeto, encontrado {type(value).__name__}")
+        return None
+    schema = _schema(kind)
+    values = {}
+    for name, field_kind, required in schema:
+        if name in value:
+            converted = _convert(value[name], field_kind, f"{path}.{name}", errors)
+            if converted is not None:
+                values[name] = converted
+        elif required:
+            errors.append(f"{path}.{name}: campo obrigatório ausente")
+    known = {name for name, _kind, _required in schema}
+    for name in value.keys() - known:
+        errors.append(f"{path}.{name}: campo desconhecido")
+    if any(required and name not in values for name, _kind, required in schema):
+        return None
+    return kind(**values)
+
+def lookup(data, path):
+    """
+    Segue um caminho como ("experience", 0, "highlights") em registros,
+    listas e dicionários. Levanta KeyError/IndexError/AttributeError se
+    algum passo não existe. Dicionários (e as visões rastreadas deles) são
+    reconhecidos pelo tipo, sem consultar atributos do valor: numa visão de
+    registro isso registraria uma dependência falsa.
+    """
+    for key in path:
+        data = data[key] if isinstance(key, int) or isinstance(data, Mapping) else getattr(data, key)
+    return data
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Leitor de PDF em streaming para o extrator de CV.
+
+Lê o arquivo via mmap e resolve os objetos sob demanda, decodificando uma
+página por vez. Apenas o necessário para CVs gerados por editores comuns
+(Google Docs, Word, LibreOffice): tabela xref clássica, streams FlateDecode,
+fontes com ToUnicode e conteúdo marcado (BDC/EMC) de PDFs com tags.
+"""
+
+import mmap
+import re
+import zlib
+from pathlib import Path
+
+_WHITESPACE = b" \t\r\n\f\x00"
+_TOKEN_RE = re.compile(
+    rb"\s*(?:"
+    rb"(?P<comment>%[^\r\n]*)"
+    rb"|(?P<dict_open><<)|(?P<dict_close>>>)"
+    rb"|(?P<array_open>\[)|(?P<array_close>\])"
+    rb"|(?P<name>/[^\s()<>\[\]{}/%]*)"
+    rb"|(?P<hex><[0-9A-Fa-f\s]*>)"
+    rb"|(?P<string>\()"
+    rb"|(?P<number>[+-]?(?:\d+\.?\d*|\.\d+))"
+    rb"|(?P<keyword>[^\s()<>\[\]{}/%]+)"
+    rb")"
+)
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+# Ligaduras tipográficas que alguns editores emitem como um único glifo
+_LIGATURES = str.maketrans({"\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl"})
+
+# Operadores de conteúdo que indicam quebra de linha dentro de um bloco
+_LINE_BREAK_OPS = {b"cm", b"T*", b"'", b'"', b"TD"}
+
+class PDFError(Exception):
+    """Erro ao interpretar a estrutura do PDF"""
+
+class Ref:
+    """Referência indireta `N G R`"""
+
+    __slots__ = ("num", "gen")
+
+    def __init__(self, num, gen):
+        self.num = num
+        self.gen = gen
+
+    def __repr__(self):
+        return f"Ref({self.num}, {self.gen})"
+
+class Operator(bytes):
+    """Palavra-chave do fluxo de conteúdo (Tj, BT, cm...)"""
+
+def _read_literal_string(data, pos):
+    """Lê uma string literal `( ... )` a partir do parêntese de abertura"""
+    out = bytearray()
+    depth = 1
+    i = pos + 1
+    while i < len(data):
+        c = data[i:i + 1]
+        if c == b"\\":
+            nxt = data[i + 1:i + 2]
+            if nxt in _ESCAPES:
+                out += _ESCAPES[nxt]
+                i += 2
+            elif nxt and nxt in b"01234567":
+                octal = re.match(rb"[0-7]{1,3}", data[i + 1:i + 4]).group(0)
+                out.append(int(octal, 8) & 0xFF)
+                i += 1 + len(octal)
+            elif nxt in (b"\r", b"\n"):
+                i += 2
+                if nxt == b"\r" and data[i:i + 1] == b"\n":
+                    i += 1
+            else:
+                # Escape desconhecido (inclusive \8 e \9): vale o próprio caractere
+                out += nxt
+                i += 2
+            continue
+        if c == b"(":
+            depth += 1
+        elif c == b")":
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+        out += c
+        i += 1
+    raise PDFError("String literal sem fechamento")
+
+def tokenize(data, pos=0):
+    """Gera (token, posição final) para um trecho de sintaxe PDF"""
+    end = len(data)
+    while pos < end:
+        m = _TOKEN_RE.match(data, pos)
+        if not m or m.end() == pos:
+            if data[pos:].strip(_WHITESPACE) == b"":
+                return
+            raise PDFError(f"Token inválido na posição {pos}")
+        kind = m.lastgroup
+        pos = m.end()
+        if kind == "comment":
+            continue
+        if kind == "string":
+            value, pos = _read_literal_string(data, m.start(kind))
+            yield value, pos
+        elif kind == "hex":
+            digits = re.sub(rb"\s", b"", m.group(kind)[1:-1])
+            if len(digits) % 2:
+                digits += b"0"
+            yield bytes.fromhex(digits.decode("ascii")), pos
+        elif kind == "number":
+            raw = m.group(kind)
+            yield (float(raw) if b"." in raw else int(raw)), pos
+        elif kind == "name":
+            yield m.group(kind)[1:].decode("latin-1"), pos
+        elif kind == "keyword":
+            word = m.group(kind)
+            if word == b"true":
+                yield True, pos
+            elif word == b"false":
+                yield False, pos
+            elif word == b"null":
+                yield None, pos
+            else:
+                yield Operator(word), pos
+        else:
+            yield Operator(m.group(kind)), pos
+
+def parse_object(data, pos=0):
+    """Interpreta um único objeto PDF; retorna (objeto, posição final)"""
+    tokens = tokenize(data, pos)
+    stack = [[]]
+    for token, pos in tokens:
+        is_op = isinstance(token, Operator)
+        if is_op and token in (b"<<", b"["):
+            stack.append([token])
+            continue
+        if is_op and token in (b">>", b"]"):
+            items = stack.pop()
+            opener, items = items[0], items[1:]
+            if token == b">>":
+                value = {items[i]: items[i + 1] for i in range(0, len(items) - 1, 2)}
+            else:
+                value = items
+            stack[-1].append(value)
+        elif is_op and token == b"R":
+            gen = stack[-1].pop()
+            num = stack[-1].pop()
+            stack[-1].append(Ref(num, gen))
+        elif is_op and len(stack) == 1:
+            # Palavra-chave fora de dicionário/array (obj, stream, endobj)
+            return (stack[0][0] if stack[0] else None), pos - len(token)
+        else:
+            stack[-1].append(token)
+        if len(stack) == 1 and stack[0] and not isinstance(stack[0][-1], int):
+            return stack[0][0], pos
+    if stack[0]:
+        return stack[0][0], pos
+    raise PDFError("Objeto vazio")
+
+class ToUnicodeMap:
+    """Mapa de códigos de glifo para texto a partir de uma CMap ToUnicode"""
+
+    def __init__(self, data):
+        self.mapping = {}
+        self.code_width = 1
+        self._parse(data)
+
+    def _parse(self, data):
+        for block in re.findall(rb"begincodespacerange(.*?)endcodespacerange", data, re.S):
+            lows = re.findall(rb"<([0-9A-Fa-f]+)>", block)
+            if lows:
+                self.code_width = len(lows[0]) // 2
+        for block in re.findall(rb"beginbfchar(.*?)endbfchar", data, re.S):
+            for src, dst in re.findall(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>", block):
+                self.mapping[int(src, 16)] = _utf16(dst)
+        for block in re.findall(rb"beginbfrange(.*?)endbfrange", data, re.S):
+            for lo, hi, dst in re.findall(
+                rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[[^\]]*\])", block
+            ):
+                lo, hi = int(lo, 16), int(hi, 16)
+                if dst.startswith(b"["):
+                    targets = re.findall(rb"<([0-9A-Fa-f]*)>", dst)
+                    for offset, target in enumerate(targets[: hi - lo + 1]):
+                        self.mapping[lo + offset] = _utf16(target)
+                    continue
+                base = dst[1:-1]
+                start = int(base, 16) if base else 0
+                for offset in range(hi - lo + 1):
+                    value = (start + offset).to_bytes(max(len(base) // 2, 2), "big")
+                    self.mapping[lo + offset] = value.decode("utf-16-be", "replace")
+
+    def decode(self, raw):
+        width = self.code_width
+        chars = []
+        for i in range(0, len(raw) - width + 1, width):
+            code = int.from_bytes(raw[i:i + width], "big")
+            chars.append(self.mapping.get(code, ""))
+        return "".join(chars)
+
+def _utf16(hex_digits):
+    return bytes.fromhex(hex_digits.decode("ascii")).decode("utf-16-be", "replace")
+
+class _SimpleFontMap:
+    """Fallback para fontes sem ToUnicode: trata os bytes como Latin-1"""
+
+    def decode(self, raw):
+        return raw.decode("latin-1")
+
+class PDFDocument:
+    """
+    Documento PDF mapeado em memória.
+
+    Nenhum conteúdo é copiado ao abrir: a tabela xref guarda só os offsets e
+    cada objeto é interpretado quando solicitado. Use como context manager.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PDFError(f"Arquivo vazio: {self.path}")
+        self._offsets = {}
+        self._fonts = {}
+        self.trailer = {}
+        self._load_xref()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._fonts.clear()
+        self._data.close()
+        self._file.close()
+
+    # --- xref -----------------------------------------------------------
+
+    def _load_xref(self):
+        data = self._data
+        marker = data.rfind(b"startxref")
+        if marker == -1:
+            self._scan_objects()
+            return
+        try:
+            start = int(data[marker + 9:marker + 40].split()[0])
+        except (ValueError, IndexError):
+            raise PDFError("startxref inválido") from None
+        seen = set()
+        while start is not None and start not in seen:
+            seen.add(start)
+            if data[start:start + 4] != b"xref":
+                # Xref em stream (PDF 1.5+) não é suportada; varre o arquivo
+                self._scan_objects()
+                return
+            start = self._read_xref_section(start + 4)
+
+    def _read_xref_section(self, pos):
+        data = self._data
+        trailer_at = data.find(b"trailer", pos)
+        if trailer_at == -1:
+            raise PDFError("Trailer não encontrado")
+        lines = data[pos:trailer_at].split(b"\n")
+        entries = iter(line.strip() for line in lines if line.strip())
+        try:
+            for header in entries:
+                first, count = (int(x) for x in header.split()[:2])
+                for num in range(first, first + count):
+                    offset, _gen, kind = next(entries).split()[:3]
+                    if kind == b"n" and num not in self._offsets:
+                        self._offsets[num] = int(offset)
+        except (ValueError, StopIteration):
+            raise PDFError("Tabela xref inválida") from None
+        trailer, _ = parse_object(data[trailer_at + 7:data.find(b"startxref", trailer_at)])
+        for key, value in trailer.items():
+            self.trailer.setdefault(key, value)
+        return trailer.get("Prev")
+
+    def _scan_objects(self):
+        for m in re.finditer(rb"(\d+)\s+(\d+)\s+obj\b", self._data):
+            self._offsets[int(m.group(1))] = m.start()
+        for m in re.finditer(rb"trailer\s*(<<)", self._data):
+            trailer, _ = parse_object(self._data[m.start(1):m.start(1) + 4096])
+            self.trailer.update(trailer)
+
+    # --- objetos --------------------------------------------------------
+
+    def resolve(self, value):
+        """Segue referências indiretas até um objeto direto"""
+        while isinstance(value, Ref):
+            value = self._load(value.num)
+        return value
+
+    def _load(self, num):
+        offset = self._offsets.get(num)
+        if offset is None:
+            return None
+        data = self._data
+        header_end = data.find(b"obj", offset) + 3
+        end = data.find(b"endobj", header_end)
+        stream_at = data.find(b"stream", header_end, end if end != -1 else len(data))
+        limit = stream_at if stream_at != -1 else end
+        obj, _ = parse_object(data[header_end:limit])
+        if stream_at != -1 and isinstance(obj, dict):
+            return _Stream(self, obj, stream_at + 6)
+        return obj
+
+    def read_stream(self, stream):
+        """Bytes decodificados de um stream"""
+        if not isinstance(stream, _Stream):
+            raise PDFError(f"Stream esperado, encontrado {type(stream).__name__}")
+        data = self._data
+        start = stream.offset
+        if data[start:start + 2] == b"\r\n":
+            start += 2
+        elif data[start:start + 1] in (b"\n", b"\r"):
+            start += 1
+        length = self.resolve(stream.dict.get("Length"))
+        if not isinstance(length, int):
+            length = data.find(b"endstream", start) - start
+        raw = data[start:start + length]
+        filters = self.resolve(stream.dict.get("Filter"))
+        if filters is None:
+            return raw
+        if not isinstance(filters, list):
+            filters = [filters]
+        for name in filters:
+            if name != "FlateDecode":
+                raise PDFError(f"Filtro não suportado: {name}")
+            try:
+                raw = zlib.decompressobj().decompress(raw)
+            except zlib.error as error:
+                raise PDFError(f"Stream corrompido: {error}") from None
+        return raw
+
+    # --- páginas --------------------------------------------------------
+
+    def iter_pages(self):
+        """Percorre a árvore de páginas gerando um dicionário por página"""
+        root = self.resolve(self.trailer.get("Root"))
+        if not root:
+            raise PDFError("Catálogo não encontrado")
+        stack = [self.resolve(root.get("Pages"))]
+        while stack:
+            node = stack.pop()
+            if node.get("Type") == "Pages" or "Kids" in node:
+                kids = self.resolve(node.get("Kids")) or []
+                stack.extend(self.resolve(kid) for kid in reversed(kids))
+            else:
+                yield node
+
+    def page_content(self, page):
+        contents = self.resolve(page.get("Contents"))
+        if contents is None:
+            return b""
+        if not isinstance(contents, list):
+            contents = [contents]
+        return b"\n".join(self.read_stream(self.resolve(c)) for c in contents)
+
+    def _font_map(self, font_ref):
+        key = font_ref.num if isinstance(font_ref, Ref) else id(font_ref)
+        font_map = self._fonts.get(key)
+        if font_map is None:
+            font = self.resolve(font_ref) or {}
+            to_unicode = self.resolve(font.get("ToUnicode"))
+            if isinstance(to_unicode, _Stream):
+                font_map = ToUnicodeMap(self.read_stream(to_unicode))
+            else:
+                font_map = _SimpleFontMap()
+            self._fonts[key] = font_map
+        return font_map
+
+    def iter_blocks(self):
+        """
+        Gera (página, tag, texto) para cada bloco de conteúdo marcado.
+
+        Em PDFs com tags a tag é a estrutura lógica (H1, H2, P, LI...); nos
+        demais cada linha de texto vira um bloco com tag "P".
+        """
+        for page_number, page in enumerate(self.iter_pages(), start=1):
+            resources = self.resolve(page.get("Resources")) or {}
+            fonts = self.resolve(resources.get("Font")) or {}
+            content = self.page_content(page)
+            yield from (
+                (page_number, tag, text)
+                for tag, text in self._walk_content(content, fonts)
+            )
+            del content
+
+    def _walk_content(self, content, fonts):
+        tags = []
+        parts = []
+        font_map = _SimpleFontMap()
+        operands = []
+
+        def flush():
+            text = " ".join("".join(parts).translate(_LIGATURES).split())
+            parts.clear()
+            if text:
+                return (tags[0] if tags else "P"), text
+            return None
+
+        for token, _ in tokenize(content):
+            if not isinstance(token, Operator) or token in (b"<<", b">>", b"[", b"]"):
+                operands.append(token)
+                continue
+            op = bytes(token)
+            if op in (b"BDC", b"BMC"):
+                # Tags aninhadas (Span de ligaduras, links) pertencem ao bloco externo
+                if not tags:
+                    block = flush()
+                    if block:
+                        yield block
+                tags.append(next((o for o in operands if isinstance(o, str)), "P"))
+            elif op == b"EMC":
+                if len(tags) == 1:
+                    block = flush()
+                    if block:
+                        yield block
+                if tags:
+                    tags.pop()
+            elif op == b"Tf":
+                names = [o for o in operands if isinstance(o, str)]
+                if names and names[-1] in fonts:
+                    font_map = self._font_map(fonts[names[-1]])
+            elif op in (b"Tj", b"'", b'"'):
+                if op != b"Tj" and parts and not parts[-1].endswith(" "):
+                    parts.append(" ")
+                strings = [o for o in operands if isinstance(o, bytes) and not isinstance(o, Operator)]
+                if strings:
+                    parts.append(font_map.decode(strings[-1]))
+            elif op == b"TJ":
+                for item in operands:
+                    if isinstance(item, bytes) and not isinstance(item, Operator):
+                        parts.append(font_map.decode(item))
+                    elif isinstance(item, (int, float)) and item < -200:
+                        parts.append(" ")
+            elif op in _LINE_BREAK_OPS and parts and not parts[-1].endswith(" "):
+                parts.append(" ")
+            operands.clear()
+        block = flush()
+        if block:
+            yield block
+
+class _Stream:
+    """Stream ainda não decodificado: guarda só o dicionário e o offset"""
+
+    __slots__ = ("doc", "dict", "offset")
+
+    def __init__(self, doc, stream_dict, offset):
+        self.doc = doc
+        self.dict = stream_dict
+        self.offset = offset
+
+    def get(self, key, default=None):
+        return self.dict.get(key, default)
+
+# Erros de tipo/índice vindos de objetos com estrutura inesperada
+_MALFORMED = (AttributeError, TypeError, ValueError, IndexError, KeyError, RecursionError)
+
+def iter_text_blocks(path):
+    """
+    Atalho: gera (página, tag, texto) de um PDF fechando o arquivo ao
+    final. Qualquer PDF malformado termina em PDFError.
+    """
+    try:
+        with PDFDocument(path) as doc:
+            yield from doc.iter_blocks()
+    except _MALFORMED as error:
+        raise PDFError(f"Estrutura inválida: {error}") from error
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Grafo de dependências entre as seções de cv_data e os arquivos gerados.
+
+Cada arquivo é renderizado a partir de uma visão rastreada de cv_data que
+registra os caminhos lidos, como ("experience", 0, "highlights"). Na
+execução seguinte, o diff contra o cv_data.json anterior diz quais caminhos
+mudaram, e só os arquivos que leram algum deles são renderizados de novo.
+Registros tipados (cv_model) são lidos por atributo, com o mesmo caminho.
+"""
+
+from collections.abc import Mapping
+from dataclasses import asdict, is_dataclass
+
+class DependencyTracker:
+    """Registra os caminhos de cv_data lidos durante uma renderização"""
+
+    def __init__(self, data):
+        self.data = data
+        self.paths = set()
+
+    @property
+    def root(self):
+        return _wrap(self, self.data, ())
+
+    def record(self, path):
+        self.paths.add(path)
+
+class _DictView(Mapping):
+    __slots__ = ("_tracker", "_raw", "_path")
+
+    def __init__(self, tracker, raw, path):
+        self._tracker = tracker
+        self._raw = raw
+        self._path = path
+
+    def __getitem__(self, key):
+        path = self._path + (key,)
+        if key not in self._raw:
+            self._tracker.record(path)
+        return _wrap(self._tracker, self._raw[key], path)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key):
+        if key not in self._raw:
+            self._tracker.record(self._path + (key,))
+            return False
+        return True
+
+    def __iter__(self):
+        self._tracker.record(self._path)
+        return iter(self._raw)
+
+    def __len__(self):
+        self._tracker.record(self._path)
+        return len(self._raw)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        return [self[key] for key in self]
+
+class _ListView:
+    __slots__ = ("_tracker", "_raw", "_path")
+
+    def __init__(self, tracker, raw, path):
+        self._tracker = tracker
+        self._raw = raw
+        self._path = path
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._tracker.record(self._path)
+            return self._raw[index]
+        if index < 0:
+            index += len(self._raw)
+        path = self._path + (index,)
+        if not 0 <= index < len(self._raw):
+            self._tracker.record(self._path)
+        return _wrap(self._tracker, self._raw[index], path)
+
+    def __iter__(self):
+        # Iterar depende da quantidade de itens: registra a lista inteira
+        self._tracker.record(self._path)
+        return (_wrap(self._tracker, item, self._path + (i,)) for i, item in enumerate(self._raw))
+
+    def __len__(self):
+        self._tracker.record(self._path)
+        return len(self._raw)
+
+class _RecordView:
+    __slots__ = ("_tracker", "_raw", "_path")
+
+    def __init__(self, tracker, raw, path):
+        self._tracker = tracker
+        self._raw = raw
+        self._path = path
+
+    def __getattr__(self, name):
+        path = self._path + (name,)
+        if not hasattr(self._raw, name):
+            self._tracker.record(path)
+        return _wrap(self._tracker, getattr(self._raw, name), path)
+
+def _wrap(tracker, value, path):
+    if is_dataclass(value):
+        return _RecordView(tracker, value, path)
+    if isinstance(value, dict):
+        return _DictView(tracker, value, path)
+    if isinstance(value, list):
+        return _ListView(tracker, value, path)
+    tracker.record(path)
+    return value
+
+def unwrap(value):
+    """
+    Função `default` para json.dumps: uma visão que chegou à saída sem ser
+    percorrida (ex.: a lista de tecnologias copiada inteira) depende da
+    subárvore toda. Registros viram dicionários.
+    """
+    if isinstance(value, (_DictView, _ListView, _RecordView)):
+        value._tracker.record(value._path)
+        value = value._raw
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (dict, list)):
+        return value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def diff_paths(old, new, path=()):
+    """Conjunto de caminhos onde old e new diferem"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed = set()
+        for key in old.keys() | new.keys():
+            if key not in old or key not in new:
+                changed.add(path + (key,))
+            else:
+                changed |= diff_paths(old[key], new[key], path + (key,))
+        return changed
+    if isinstance(old, list) and isinstance(new, list):
+        changed = set()
+        for index in range(min(len(old), len(new))):
+            changed |= diff_paths(old[index], new[index], path + (index,))
+        # Itens adicionados ou removidos mudam só os índices excedentes; quem
+        # iterou a lista registrou o caminho dela, que é prefixo destes
+        for index in range(min(len(old), len(new)), max(len(old), len(new))):
+            changed.add(path + (index,))
+        return changed
+    return set() if old == new else {path}
+
+def is_affected(dependencies, changed):
+    """Algum caminho lido é prefixo de um caminho alterado, ou vice-versa?"""
+    for dependency in dependencies:
+        for change in changed:
+            size = min(len(dependency), len(change))
+            if dependency[:size] == change[:size]:
+                return True
+    return False
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Servidor de desenvolvimento com live reload.
+
+Serve os arquivos do site como o `python -m http.server` (primeiro os
+gerados na pasta de saída, depois os do template: CSS, JS, imagens) e
+mantém um endpoint de Server-Sent Events (/__livereload). As páginas HTML recebem,
+só ao serem servidas por aqui, um script que recarrega a página quando o
+modo --watch do extract_cv.py avisa que arquivos foram regravados. O
+sw.js não é servido aqui: o cache dele atrasaria o live reload.
+"""
+
+import json
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from images import SOURCE_ROOT
+from service_worker import SERVICE_WORKER
+
+LIVERELOAD_PATH = "/__livereload"
+# Intervalo do comentário de keep-alive do SSE, em segundos
+KEEPALIVE = 15
+
+_CLIENT_SCRIPT = (
+    "<script>new EventSource('" + LIVERELOAD_PATH + "')"
+    ".onmessage = () => location.reload();</script>"
+).encode("utf-8")
+
+class LiveReload:
+    """Contador de versões compartilhado entre o watcher e as conexões SSE"""
+
+    def __init__(self):
+        self.version = 0
+        self.paths = []
+        self._condition = threading.Condition()
+
+    def notify(self, paths):
+        with self._condition:
+            self.version += 1
+            self.paths = list(paths)
+            self._condition.notify_all()
+
+    def wait(self, version, timeout):
+        """Espera uma versão diferente de version; retorna a versão atual"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+class _Handler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, livereload, fallback, **kwargs):
+        self.livereload = livereload
+        self.fallback = fallback
+        super().__init__(*args, **kwargs)
+
+    def translate_path(self, path):
+        translated = super().translate_path(path)
+        if os.path.exists(translated):
+            return translated
+        # Arquivos estáticos que só existem no template
+        candidate = os.path.join(self.fallback, os.path.relpath(translated, self.directory))
+        return candidate if os.path.exists(candidate) else translated
+
+    def do_GET(self):
+        if self.path == LIVERELOAD_PATH:
+            self._stream_events()
+            return
+        if self.path.split("?")[0] == "/" + SERVICE_WORKER:
+            self.send_error(404)
+            return
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            self._send_html(path)
+            return
+        super().do_GET()
+
+    def _send_html(self, path):
+        body = path.read_bytes()
+        marker = body.rfind(b"</body>")
+        body = body[:marker] + _CLIENT_SCRIPT + body[marker:] if marker != -1 else body + _CLIENT_SCRIPT
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        version = self.livereload.version
+        try:
+            while True:
+                current = self.livereload.wait(version, KEEPALIVE)
+                if current == version:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    version = current
+                    self.wfile.write(f"data: {json.dumps(self.livereload.paths)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def serve(root, port, livereload, fallback=SOURCE_ROOT):
+    """Inicia o servidor em uma thread daemon e o retorna"""
+    handler = partial(_Handler, directory=str(root), livereload=livereload, fallback=str(fallback))
+    server = ThreadingHTTPServer(("", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
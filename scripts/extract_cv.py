@@ -3,18 +3,79 @@
 Script para extrair informações do CV PDF e converter para JSON
 """
 
+import argparse
 import json
+import os
 import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
-def extract_cv_info():
+from assets import assets_stale, update_assets
+from build_cache import BuildManifest, ContentStore, sha256_bytes, sha256_file
+from bundles import inline_bundle_map, update_bundles
+from cv_model import CVData, CVValidationError
+from cv_pdf import PDFError, iter_text_blocks
+from dependency_graph import DependencyTracker, diff_paths
+from images import collect_image_sources, images_stale, optimize_images
+from json_stream import DEFAULT_FORMAT, OUTPUT_FORMATS, iter_json_bytes
+from locale_renderer import LOCALES_DIR, load_locale_renderer
+from prerender import read_template, template_stale, update_pages
+from profiling import NULL_PROFILER, Profiler, save_trace
+from search_index import update_search_index
+from service_worker import precache_stale, update_service_worker
+from tech_facets import FACETS_FILE, reference_date, render_technology_facets
+from tenants import STORE_DIR, collect_tenant_jobs, copy_site_assets, site_assets_stale
+
+CV_PDF = "cv.pdf"
+
+# Títulos de seção aceitos no PDF (sem acentos, em maiúsculas) -> chave em cv_data
+SECTION_HEADINGS = {
+    "EXPERIENCE": "experience",
+    "EXPERIENCIA": "experience",
+    "EXPERIENCIA PROFISSIONAL": "experience",
+    "WORK EXPERIENCE": "experience",
+    "EDUCATION": "education",
+    "EDUCACAO": "education",
+    "FORMACAO": "education",
+    "FORMACAO ACADEMICA": "education",
+    "CERTIFICATIONS": "certifications",
+    "CERTIFICACOES": "certifications",
+    "SKILLS": "skills",
+    "HABILIDADES": "skills",
+    "PROJECTS": "projects",
+    "PROJETOS": "projects",
+    "HIGHLIGHTS": "awards",
+    "DESTAQUES": "awards",
+    "AWARDS": "awards",
+    "PREMIOS": "awards",
+    "LANGUAGES": "languages",
+    "IDIOMAS": "languages",
+}
+
+# Categoria de cada tecnologia conhecida; o resto vai para "tools"
+SKILL_CATEGORIES = {
+    "frontend": {"react", "typescript", "javascript", "js", "html", "css", "vue", "vue.js", "angular", "next.js"},
+    "backend": {"node", "node.js", "express", "postgres", "postgresql", "mysql", "typeorm", "prisma.io", "prisma", "php"},
+    "devops": {"aws", "aws-s3", "aws-ec2", "ci/cd", "docker", "kubernetes", "socket.io"},
+    "mobile": {"react native", "expo", "google maps", "sso"},
+}
+
+_TECH_PREFIX_RE = re.compile(r"^(?:main tech|tech stack|tecnologias|principais tecnologias)\s*:\s*", re.I)
+_LIST_SPLIT_RE = re.compile(r"\s*(?:,|;|\band\b|\be\b)\s*")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+def default_cv_info():
     """
-    Extrai informações do CV PDF (simulado - você precisará ajustar com base no conteúdo real)
+    Dados de referência do CV, editados à mão.
+
+    Usados quando o PDF não existe e para completar seções que o PDF não
+    traz (projetos, certificações, resumo).
     """
     
-    # Como não posso ler o PDF diretamente, vou criar um template baseado no que seria esperado
-    # Você pode ajustar estas informações com base no seu CV real
-    
     cv_data = {
         "personal_info": {
             "name": "Albert A. Dias",
@@ -232,232 +293,646 @@ def extract_cv_info():
     
     return cv_data
 
-def save_cv_data():
-    """Salva os dados do CV em arquivos JSON"""
+def _fold(text):
+    """Remove acentos e normaliza para comparação de títulos"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).upper().strip(" :")
+
+def _split_list(text):
+    """Divide "A, B and C" em ["A", "B", "C"]"""
+    text = _TECH_PREFIX_RE.sub("", text).rstrip(".")
+    return [item for item in _LIST_SPLIT_RE.split(text) if item]
+
+def _split_entry_title(text):
+    """
+    Divide um título de entrada "Empresa, Local — Cargo" em
+    (empresa, local, cargo). O travessão pode vir sem espaços.
+    """
+    head, position = (re.split(r"\s*[—–]\s*", text, maxsplit=1) + [""])[:2]
+    name, _, location = head.partition(",")
+    return name.strip(), location.strip(), position.strip()
+
+def _categorize_skills(items):
+    skills = {category: [] for category in SKILL_CATEGORIES}
+    skills["tools"] = []
+    for item in items:
+        key = item.lower()
+        category = next((c for c, names in SKILL_CATEGORIES.items() if key in names), "tools")
+        if item not in skills[category]:
+            skills[category].append(item)
+    return {category: values for category, values in skills.items() if values}
+
+def _slugify(text):
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", folded.lower()).strip("-")
+
+def parse_cv_blocks(blocks):
+    """
+    Monta a estrutura de cv_data a partir dos blocos (página, tag, texto)
+    do PDF, consumindo-os um a um.
+
+    Layout esperado (o do Google Docs): o primeiro H1 é o nome, seguido dos
+    contatos; cada seção começa com um H1; entradas de experiência e formação
+    são um H2 "Empresa, Local — Cargo" seguido de um H3 com o período.
+    """
+    cv_data = {
+        "personal_info": {},
+        "experience": [],
+        "education": [],
+        "certifications": [],
+        "skills": {},
+        "projects": [],
+        "awards": [],
+        "languages": [],
+    }
+    personal = cv_data["personal_info"]
+    skill_items = []
+    section = "personal_info"
+    entry = None
+    last_entry = None
+    last_section = None
+    pending_label = None
+    last_page = None
+
+    for page, tag, text in blocks:
+        # Em layouts de duas colunas o fluxo principal continua na página
+        # seguinte: volta para a seção da última entrada aberta
+        if page != last_page and last_entry is not None:
+            section, entry = last_section, last_entry
+        last_page = page
+
+        if tag == "H1":
+            key = SECTION_HEADINGS.get(_fold(text))
+            if key:
+                section = key
+                entry = None
+            elif not personal.get("name"):
+                personal["name"] = text
+            continue
+
+        if section == "personal_info":
+            label = _fold(text)
+            if label in ("PHONE", "TELEFONE", "EMAIL", "E-MAIL"):
+                pending_label = "phone" if label in ("PHONE", "TELEFONE") else "email"
+            elif pending_label:
+                personal[pending_label] = text
+                pending_label = None
+            elif "@" in text and not personal.get("email"):
+                personal["email"] = text
+            elif not personal.get("location"):
+                parts = [p.strip() for p in text.split(",")]
+                personal["location"] = ", ".join(parts[-3:])
+            continue
+
+        if section in ("experience", "education", "certifications", "projects"):
+            if tag == "H2":
+                name, location, role = _split_entry_title(text)
+                entry = _new_entry(section, name, location, role)
+                last_entry, last_section = entry, section
+                cv_data[section].append(entry)
+            elif entry is None:
+                continue
+            elif tag == "H3":
+                entry["date" if section == "certifications" else "period"] = text.title().replace("Present", "Presente")
+            elif _TECH_PREFIX_RE.match(text):
+                entry.setdefault("technologies", []).extend(_split_list(text))
+            else:
+                entry["description"] = f"{entry['description']} {text}".strip()
+        elif section == "skills":
+            items = _split_list(text)
+            # Frases descritivas ("I have experience with...") não são listas
+            if len(items) > 1 and all(len(item.split()) <= 3 for item in items):
+                skill_items.extend(items)
+        elif section == "awards":
+            cv_data["awards"].append({"name": text, "issuer": "", "date": "", "description": text})
+        elif section == "languages":
+            for item in _split_list(text):
+                name, _, level = item.partition("(")
+                cv_data["languages"].append({"name": name.strip(), "level": level.rstrip(")").strip().capitalize()})
+
+    for item in cv_data["experience"]:
+        if not item["highlights"]:
+            item["highlights"] = _SENTENCE_RE.split(item["description"])[:3]
+    cv_data["skills"] = _categorize_skills(skill_items)
+    return cv_data
+
+def _new_entry(section, name, location, role):
+    if section == "experience":
+        return {"company": name, "position": role, "period": "", "location": location,
+                "description": "", "technologies": [], "highlights": []}
+    if section == "education":
+        return {"institution": name, "degree": role, "period": "", "description": ""}
+    if section == "certifications":
+        return {"name": role or name, "issuer": name, "date": "", "description": ""}
+    return {"id": _slugify(name), "title": name, "description": "", "technologies": [],
+            "images": [], "liveUrl": "#", "repoUrl": "#", "featured": False}
+
+def extract_cv_info(pdf_path=CV_PDF):
+    """
+    Extrai as informações do CV a partir do PDF, validadas e convertidas
+    em CVData (levanta CVValidationError).
+    """
+    return CVData.from_dict(extract_raw_cv_info(pdf_path))
+
+def extract_raw_cv_info(pdf_path=CV_PDF):
+    """
+    Dicionário cv_data ainda não validado.
+
+    O PDF é lido em streaming (mmap, uma página por vez). Seções ausentes ou
+    vazias no PDF são completadas com default_cv_info(); sem o PDF, retorna
+    apenas os dados de referência. Um .json (perfil do modo multi-tenant)
+    já é o cv_data e é lido como está.
+    """
+    fallback = default_cv_info()
+    if not Path(pdf_path).exists():
+        return fallback
+    if Path(pdf_path).suffix == ".json":
+        with open(pdf_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    try:
+        cv_data = parse_cv_blocks(iter_text_blocks(pdf_path))
+    except PDFError as error:
+        print(f"⚠️  Não foi possível ler {pdf_path}: {error}")
+        return fallback
+
+    personal = dict(fallback["personal_info"])
+    personal.update({key: value for key, value in cv_data["personal_info"].items() if value})
+    if cv_data["experience"] and "headline" not in cv_data["personal_info"]:
+        personal["headline"] = cv_data["experience"][0]["position"] or personal["headline"]
+    cv_data["personal_info"] = personal
+
+    for key, value in fallback.items():
+        if not cv_data.get(key):
+            cv_data[key] = value
+    return {key: cv_data[key] for key in fallback}
+
+def _write_json(manifest, relative_path, data, output_format=DEFAULT_FORMAT):
+    """
+    Grava um JSON no site do manifesto, apenas se o conteúdo mudou. O JSON
+    é codificado e gravado em partes (json_stream), inclusive geradores.
+    """
+    return manifest.write_stream(relative_path, iter_json_bytes(data, output_format))
+
+def _render_output(manifest, relative_path, render, cv_data, changed=None, output_format=DEFAULT_FORMAT):
+    """
+    Renderiza um arquivo a partir de cv_data registrando os caminhos lidos.
+    Se nenhum deles está em changed, o arquivo é pulado sem renderizar.
+    """
+    if not manifest.needs_render(relative_path, changed):
+        manifest.skipped.append(relative_path)
+        return False
+    tracker = DependencyTracker(cv_data)
+    data = render(tracker.root)
+    written = _write_json(manifest, relative_path, data, output_format)
+    manifest.dependencies[relative_path] = tracker.paths
+    return written
+
+def _load_previous_cv_data(manifest):
+    """cv_data.json da execução anterior, se ainda é o que o manifesto registrou"""
+    if not manifest.is_fresh('cv_data.json'):
+        return None
+    try:
+        with open(manifest.root / 'cv_data.json', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def pdf_input_key(pdf_path):
+    """Hash do PDF de entrada"""
+    return sha256_file(pdf_path) if Path(pdf_path).exists() else "sem-pdf"
+
+def _generator_key(output_format=DEFAULT_FORMAT, bundle_assets=False):
+    """
+    Hash do código do gerador, dos catálogos de idiomas, do formato de
+    saída, da opção de pacotes de CSS/JS e do mês de referência de
+    "Presente": uma mudança em qualquer um deles invalida o cache e as
+    dependências registradas.
+    """
+    sources = sorted(Path(__file__).parent.glob("*.py")) + sorted(LOCALES_DIR.glob("*.json"))
+    parts = [sha256_file(source) for source in sources] + [
+        output_format, f"bundle={bundle_assets}", f"asof={reference_date().isoformat()}",
+    ]
+    return sha256_bytes("\n".join(parts).encode("ascii"))
+
+def save_cv_data(pdf_path=CV_PDF, output_root=".", verbose=True, force=False, executor=None, profiler=None,
+                 output_format=DEFAULT_FORMAT, bundle_assets=False, store=None):
+    """
+    Salva os dados do CV em arquivos JSON dentro de output_root.
+
+    Se o PDF e o gerador não mudaram desde a última execução (e os arquivos
+    gerados estão intactos), nada é feito. Caso contrário, só os arquivos
+    cujo conteúdo mudou são regravados. Retorna o manifesto da execução.
+    output_format é um de json_stream.OUTPUT_FORMATS. Com bundle_assets, o
+    CSS e o JS do index.html viram pacotes minificados (ver assets.py); um
+    CSS/JS alterado também invalida o cache, assim como uma imagem de
+    origem ou um arquivo do precache editados. Com um ContentStore (modo
+    multi-tenant), o site recebe também os arquivos do template e tudo é
+    gravado por hard link a partir do store.
+
+    Com um profiling.Profiler, cada etapa é medida (tempo, alocações,
+    bytes gravados, acertos do cache).
+    """
+    
+    profiler = profiler or NULL_PROFILER
+    manifest = BuildManifest.load(output_root)
+    manifest.store = store
+    with profiler.stage("cache", manifest):
+        input_key = pdf_input_key(pdf_path)
+        generator_key = _generator_key(output_format, bundle_assets)
+        up_to_date = (
+            not force
+            and manifest.is_up_to_date(input_key, generator_key)
+            and not (store is not None and site_assets_stale(manifest, pdf_path))
+            and not assets_stale(manifest)
+            and not template_stale(manifest)
+            and not images_stale(manifest)
+            and not precache_stale(manifest)
+        )
+        if up_to_date:
+            manifest.skipped.extend(manifest.outputs)
+    if up_to_date:
+        if verbose:
+            print("✅ CV sem alterações, nada a atualizar")
+        return manifest
+    
+    with profiler.stage("extract"):
+        raw_data = extract_raw_cv_info(pdf_path)
+    
+    # Validado aqui: um CV inválido falha antes de qualquer gravação
+    with profiler.stage("validate"):
+        cv_data = CVData.from_dict(raw_data)
+        del raw_data
+        
+        # Seções alteradas desde a última execução (None = renderizar tudo)
+        changed = None
+        if not force and manifest.generator_key == generator_key:
+            previous = _load_previous_cv_data(manifest)
+            if previous is not None:
+                changed = diff_paths(previous, cv_data.to_dict())
     
-    cv_data = extract_cv_info()
+    # Arquivos do template só depois da validação: um perfil inválido não
+    # deixa nada gravado
+    if store is not None:
+        with profiler.stage("site", manifest):
+            copy_site_assets(manifest, pdf_path)
     
-    # Salvar dados completos
-    with open('cv_data.json', 'w', encoding='utf-8') as f:
-        json.dump(cv_data, f, ensure_ascii=False, indent=2)
+    emit_outputs(cv_data, manifest, changed, executor, profiler, output_format, bundle_assets)
+    
+    with profiler.stage("write", manifest):
+        manifest.input_key = input_key
+        manifest.generator_key = generator_key
+        manifest.save()
+    
+    if verbose:
+        print("✅ Dados do CV extraídos e salvos com sucesso!")
+        print("📁 Arquivos:")
+        for relative_path in manifest.written:
+            print(f"   - {relative_path} (atualizado)")
+        for relative_path in manifest.skipped:
+            print(f"   - {relative_path} (sem alterações)")
+        for relative_path in manifest.removed:
+            print(f"   - {relative_path} (removido)")
+    return manifest
+
+def build_assets(output_root=".", verbose=True):
+    """
+    Só os pacotes de idioma, os de CSS/JS do index.html e o precache
+    (--assets-only), sem extrair o CV: as traduções e os conteúdos
+    versionados (editados à mão) ficam como estão e viram os pacotes. É o
+    build da publicação.
+    """
+    manifest = BuildManifest.load(output_root)
+    bundle_map = update_bundles(manifest, load_locale_renderer().locales)
+    index_path = manifest.root / "index.html"
+    html = index_path.read_text(encoding="utf-8")
+    updated = update_assets(manifest, True, inline_bundle_map(html, bundle_map))
+    if updated != html:
+        manifest.write("index.html", updated.encode("utf-8"))
+    update_service_worker(manifest)
+    manifest.save()
+    if verbose:
+        print("✅ Pacotes de idioma e de CSS/JS atualizados")
+        for relative_path in manifest.written:
+            print(f"   - {relative_path} (atualizado)")
+        for relative_path in manifest.removed:
+            print(f"   - {relative_path} (removido)")
+    return manifest
+
+def emit_outputs(cv_data, manifest, changed=None, executor=None, profiler=None, output_format=DEFAULT_FORMAT,
+                 bundle_assets=False):
+    """
+    Gera todos os arquivos do site a partir de um CVData já validado.
+    changed é o diff contra os dados anteriores (None = renderizar tudo).
+    Não salva o manifesto.
+    """
+    profiler = profiler or NULL_PROFILER
+    output_root = manifest.root
+    
+    # Salvar dados completos, direto dos registros
+    with profiler.stage("write", manifest):
+        _write_json(manifest, 'cv_data.json', cv_data, output_format)
     
     # Atualizar arquivos de tradução
-    update_translations(cv_data)
+    with profiler.stage("translations", manifest):
+        update_translations(cv_data, output_root, manifest, changed, executor, output_format)
+    
+    # Variantes otimizadas das imagens; se os metadados mudaram, os
+    # projetos precisam ser renderizados de novo
+    with profiler.stage("images", manifest):
+        media, media_changed = optimize_images(manifest, collect_image_sources(cv_data), executor)
     
     # Atualizar projetos
-    update_projects(cv_data)
-    
-    print("✅ Dados do CV extraídos e salvos com sucesso!")
-    print("📁 Arquivos criados:")
-    print("   - cv_data.json (dados completos)")
-    print("   - i18n/en.json (atualizado)")
-    print("   - i18n/pt.json (atualizado)")
-    print("   - content/projects.en.json (atualizado)")
-    print("   - content/projects.pt.json (atualizado)")
-
-def update_translations(cv_data):
-    """Atualiza os arquivos de tradução com dados reais do CV"""
-    
-    # Dados em inglês
-    en_data = {
-        "nav": {
-            "logo": cv_data["personal_info"]["name"],
-            "home": "Home",
-            "about": "About",
-            "experience": "Experience",
-            "projects": "Projects",
-            "skills": "Skills",
-            "contact": "Contact"
-        },
-        "hero": {
-            "name": cv_data["personal_info"]["name"],
-            "headline": cv_data["personal_info"]["headline"],
-            "description": cv_data["personal_info"]["summary"],
-            "downloadCv": "Download CV",
-            "contact": "Get in Touch"
-        },
-        "about": {
-            "title": "About Me",
-            "description": cv_data["personal_info"]["summary"],
-            "passion": "I love turning complex problems into simple, beautiful, and intuitive solutions. When I'm not coding, you can find me exploring new technologies, contributing to open source projects, or sharing knowledge with the developer community.",
-            "techStack": "Tech Stack"
-        },
-        "experience": {
-            "title": "Experience",
-            "current": {
-                "description": cv_data["experience"][0]["description"],
-                "highlight1": cv_data["experience"][0]["highlights"][0],
-                "highlight2": cv_data["experience"][0]["highlights"][1],
-                "highlight3": cv_data["experience"][0]["highlights"][2]
-            },
-            "previous": {
-                "description": cv_data["experience"][1]["description"],
-                "highlight1": cv_data["experience"][1]["highlights"][0],
-                "highlight2": cv_data["experience"][1]["highlights"][1],
-                "highlight3": cv_data["experience"][1]["highlights"][2]
-            }
-        },
-        "projects": {
-            "title": "Featured Projects",
-            "viewLive": "View Live",
-            "viewRepo": "View Repo"
-        },
-        "skills": {
-            "title": "Skills",
-            "frontend": "Frontend",
-            "backend": "Backend",
-            "devops": "DevOps",
-            "testing": "Testing",
-            "data": "Data",
-            "tools": "Tools"
-        },
-        "contact": {
-            "title": "Get In Touch",
-            "info": {
-                "title": "Let's work together",
-                "description": "I'm always interested in new opportunities and exciting projects. Feel free to reach out if you'd like to collaborate!"
-            },
-            "form": {
-                "name": "Name",
-                "email": "Email",
-                "subject": "Subject",
-                "message": "Message",
-                "submit": "Send Message",
-                "success": "Message sent successfully!",
-                "error": "Failed to send message. Please try again."
-            }
-        },
-        "footer": {
-            "rights": "All rights reserved.",
-            "source": "View Source"
-        }
-    }
+    with profiler.stage("projects", manifest):
+        update_projects(cv_data, output_root, manifest, None if media_changed else changed, media, output_format)
     
-    # Dados em português
-    pt_data = {
-        "nav": {
-            "logo": cv_data["personal_info"]["name"],
-            "home": "Início",
-            "about": "Sobre",
-            "experience": "Experiência",
-            "projects": "Projetos",
-            "skills": "Habilidades",
-            "contact": "Contato"
-        },
-        "hero": {
-            "name": cv_data["personal_info"]["name"],
-            "headline": cv_data["personal_info"]["headline"],
-            "description": cv_data["personal_info"]["summary"],
-            "downloadCv": "Baixar CV",
-            "contact": "Entre em Contato"
-        },
-        "about": {
-            "title": "Sobre Mim",
-            "description": cv_data["personal_info"]["summary"],
-            "passion": "Adoro transformar problemas complexos em soluções simples, bonitas e intuitivas. Quando não estou programando, você pode me encontrar explorando novas tecnologias, contribuindo para projetos open source ou compartilhando conhecimento com a comunidade de desenvolvedores.",
-            "techStack": "Stack Tecnológico"
-        },
-        "experience": {
-            "title": "Experiência",
-            "current": {
-                "description": cv_data["experience"][0]["description"],
-                "highlight1": cv_data["experience"][0]["highlights"][0],
-                "highlight2": cv_data["experience"][0]["highlights"][1],
-                "highlight3": cv_data["experience"][0]["highlights"][2]
-            },
-            "previous": {
-                "description": cv_data["experience"][1]["description"],
-                "highlight1": cv_data["experience"][1]["highlights"][0],
-                "highlight2": cv_data["experience"][1]["highlights"][1],
-                "highlight3": cv_data["experience"][1]["highlights"][2]
-            }
-        },
-        "projects": {
-            "title": "Projetos em Destaque",
-            "viewLive": "Ver Online",
-            "viewRepo": "Ver Repositório"
-        },
-        "skills": {
-            "title": "Habilidades",
-            "frontend": "Frontend",
-            "backend": "Backend",
-            "devops": "DevOps",
-            "testing": "Testes",
-            "data": "Dados",
-            "tools": "Ferramentas"
-        },
-        "contact": {
-            "title": "Entre em Contato",
-            "info": {
-                "title": "Vamos trabalhar juntos",
-                "description": "Estou sempre interessado em novas oportunidades e projetos emocionantes. Sinta-se à vontade para entrar em contato se quiser colaborar!"
-            },
-            "form": {
-                "name": "Nome",
-                "email": "Email",
-                "subject": "Assunto",
-                "message": "Mensagem",
-                "submit": "Enviar Mensagem",
-                "success": "Mensagem enviada com sucesso!",
-                "error": "Falha ao enviar mensagem. Tente novamente."
-            }
-        },
-        "footer": {
-            "rights": "Todos os direitos reservados.",
-            "source": "Ver Código Fonte"
+    # Facetas de tecnologias (contagens, anos de uso, projetos/experiências)
+    with profiler.stage("technologies", manifest):
+        update_technologies(cv_data, output_root, manifest, changed, output_format)
+    
+    # Índice de busca por idioma (projetos + experiências)
+    with profiler.stage("search", manifest):
+        update_search_index(manifest, cv_data, load_locale_renderer().locales)
+    
+    # Pacotes por idioma (traduções + projetos) minificados e comprimidos
+    with profiler.stage("bundles", manifest):
+        bundle_map = update_bundles(manifest, load_locale_renderer().locales)
+    
+    # O template nunca é regravado: os pacotes entram na cópia em memória
+    html = read_template(manifest)
+    if html is None:
+        return
+    
+    # CSS e JS do index.html em pacotes minificados (ou de volta às tags originais)
+    with profiler.stage("assets", manifest):
+        html = update_assets(manifest, bundle_assets, inline_bundle_map(html, bundle_map))
+    
+    # Páginas index.<lang>.html já traduzidas
+    with profiler.stage("pages", manifest):
+        update_pages(manifest, load_locale_renderer(), html, cv_data.personal_info.website)
+    
+    # Manifesto de precache e sw.js (depois de tudo, para ver os hashes finais)
+    with profiler.stage("precache", manifest):
+        update_service_worker(manifest)
+
+def available_cpus():
+    """Núcleos que este processo pode usar (respeita affinity/cgroups no Linux)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _save_cv_job(job, force=False, profile=False, output_format=DEFAULT_FORMAT, bundle_assets=False,
+                 store_root=None):
+    """
+    Executa save_cv_data para um par (pdf, site) dentro de um processo do
+    pool. Retorna (tempo, arquivos gravados, eventos do profiler).
+    """
+    pdf_path, output_root = job
+    profiler = Profiler(label=str(pdf_path)) if profile else None
+    store = ContentStore(store_root) if store_root else None
+    started = time.perf_counter()
+    manifest = save_cv_data(pdf_path, output_root, verbose=False, force=force, profiler=profiler,
+                            output_format=output_format, bundle_assets=bundle_assets, store=store)
+    events = profiler.events if profiler else []
+    return time.perf_counter() - started, len(manifest.written), events
+
+def collect_batch_jobs(inputs, outputs):
+    """
+    Monta a lista de pares (pdf, site) do modo batch.
+
+    inputs aceita arquivos PDF e pastas (todos os *.pdf da pasta). Com uma
+    única saída, cada CV vai para output/<nome do pdf>/; com uma saída por
+    CV, os pares seguem a ordem dos argumentos.
+    """
+    pdfs = []
+    for item in map(Path, inputs):
+        pdfs.extend(sorted(item.glob("*.pdf")) if item.is_dir() else [item])
+    if len(outputs) == 1:
+        # Dois PDFs com o mesmo nome disputariam a mesma pasta no pool
+        names = [pdf.stem for pdf in pdfs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"CVs com o mesmo nome: {', '.join(duplicates)}")
+        return [(pdf, Path(outputs[0]) / pdf.stem) for pdf in pdfs]
+    if len(outputs) != len(pdfs):
+        raise ValueError(f"{len(pdfs)} CVs para {len(outputs)} pastas de saída")
+    return list(zip(pdfs, map(Path, outputs)))
+
+def batch_save_cv_data(jobs, workers=None, force=False, profile=None, output_format=DEFAULT_FORMAT,
+                       bundle_assets=False, store_root=None):
+    """
+    Processa vários CVs em paralelo com um ProcessPoolExecutor.
+
+    Cada CV roda em um processo do pool (por padrão um por núcleo
+    disponível) e o tempo de cada arquivo é impresso ao terminar. Com
+    profile (caminho de um arquivo), as etapas de todos os CVs vão para um
+    único trace do Chrome. Com store_root (modo multi-tenant), os sites
+    compartilham um ContentStore nessa pasta. Retorna a quantidade de CVs
+    que falharam.
+    """
+    jobs = list(jobs)
+    workers = workers or available_cpus()
+    started = time.perf_counter()
+    failures = 0
+    events = []
+    
+    print(f"🚀 Processando {len(jobs)} CVs com {workers} processos")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_save_cv_job, job, force, bool(profile), output_format, bundle_assets, store_root): job
+            for job in jobs
         }
-    }
+        for future in as_completed(futures):
+            pdf_path, output_root = futures[future]
+            try:
+                elapsed, written, job_events = future.result()
+            except Exception as error:
+                failures += 1
+                print(f"   ❌ {pdf_path}: {error}")
+            else:
+                print(f"   ✅ {pdf_path} -> {output_root} ({elapsed * 1000:.1f} ms, {written} arquivos gravados)")
+                events.extend(job_events)
     
-    # Salvar arquivos de tradução
-    with open('i18n/en.json', 'w', encoding='utf-8') as f:
-        json.dump(en_data, f, ensure_ascii=False, indent=2)
-    
-    with open('i18n/pt.json', 'w', encoding='utf-8') as f:
-        json.dump(pt_data, f, ensure_ascii=False, indent=2)
-
-def update_projects(cv_data):
-    """Atualiza os arquivos de projetos com dados reais do CV"""
-    
-    # Projetos em inglês
-    en_projects = []
-    for project in cv_data["projects"]:
-        en_projects.append({
-            "id": project["id"],
-            "title": project["title"],
-            "description": project["description"],
-            "technologies": project["technologies"],
-            "images": project["images"],
-            "liveUrl": project["liveUrl"],
-            "repoUrl": project["repoUrl"],
-            "featured": project["featured"]
-        })
-    
-    # Projetos em português (mesmo conteúdo, mas com títulos traduzidos)
-    pt_projects = []
-    for project in cv_data["projects"]:
-        pt_title = project["title"]
-        if project["id"] == "ecommerce-platform":
-            pt_title = "Plataforma E-commerce"
-        elif project["id"] == "task-management-app":
-            pt_title = "App de Gerenciamento de Tarefas"
-        
-        pt_projects.append({
-            "id": project["id"],
-            "title": pt_title,
-            "description": project["description"],
-            "technologies": project["technologies"],
-            "images": project["images"],
-            "liveUrl": project["liveUrl"],
-            "repoUrl": project["repoUrl"],
-            "featured": project["featured"]
-        })
-    
-    # Salvar arquivos de projetos
-    with open('content/projects.en.json', 'w', encoding='utf-8') as f:
-        json.dump(en_projects, f, ensure_ascii=False, indent=2)
-    
-    with open('content/projects.pt.json', 'w', encoding='utf-8') as f:
-        json.dump(pt_projects, f, ensure_ascii=False, indent=2)
+    total = time.perf_counter() - started
+    print(f"⏱️  {len(jobs) - failures}/{len(jobs)} CVs em {total:.2f} s")
+    if store_root and not failures:
+        store = ContentStore(store_root)
+        pruned = store.prune()
+        files, size = store.usage()
+        print(f"🗄️  Store: {files} arquivos únicos, {size / 1024:.0f} KiB ({pruned} sem uso removidos)")
+    if profile:
+        save_trace(profile, events)
+        print(f"📈 Trace salvo em {profile}")
+    return failures
+
+def update_translations(cv_data, output_root=".", manifest=None, changed=None, executor=None,
+                        output_format=DEFAULT_FORMAT):
+    """
+    Atualiza i18n/<lang>.json de todos os idiomas em scripts/locales.
+
+    changed é o conjunto de caminhos de cv_data alterados desde a última
+    execução (None = tudo); idiomas cujo arquivo não lê nenhum deles são
+    pulados. Os demais são renderizados juntos, em paralelo se houver
+    executor.
+    """
+    
+    manifest = manifest or BuildManifest(output_root)
+    renderer = load_locale_renderer()
+    pending = []
+    for locale in renderer.locales:
+        relative_path = f'i18n/{locale}.json'
+        if manifest.needs_render(relative_path, changed):
+            pending.append(locale)
+        else:
+            manifest.skipped.append(relative_path)
+    if not pending:
+        return
+    
+    tracker = DependencyTracker(cv_data)
+    rendered = renderer.render(tracker.root, pending, executor)
+    for locale, data in rendered.items():
+        relative_path = f'i18n/{locale}.json'
+        _write_json(manifest, relative_path, data, output_format)
+        manifest.dependencies[relative_path] = tracker.paths
+
+def update_projects(cv_data, output_root=".", manifest=None, changed=None, media=None,
+                    output_format=DEFAULT_FORMAT):
+    """
+    Atualiza content/projects.<lang>.json de todos os idiomas; cada projeto
+    é renderizado e gravado um por vez.
+    """
+    
+    manifest = manifest or BuildManifest(output_root)
+    renderer = load_locale_renderer()
+    for locale in renderer.locales:
+        render = partial(renderer.iter_projects, locale=locale, media=media)
+        _render_output(manifest, f'content/projects.{locale}.json', render, cv_data, changed, output_format)
+
+def _print_profile(profiler):
+    print("📈 Etapas:")
+    for name, totals in profiler.summary().items():
+        details = [f"{totals['wall_ms']:.1f} ms"]
+        if "allocated_bytes" in totals:
+            details.append(f"pico {totals['peak_allocated_bytes'] / 1024:.0f} KiB alocados")
+        if "bytes_written" in totals:
+            details.append(f"{totals['bytes_written']} bytes gravados")
+            details.append(f"cache {totals['cache_hits']} acertos/{totals['cache_misses']} falhas")
+        print(f"   - {name}: {', '.join(details)}")
+
+def _watch(output_format, port=None):
+    # Importados aqui: watch e dev_server só existem para o modo --watch
+    from dev_server import LiveReload, serve
+    from watch import CVWatcher
+    
+    livereload = LiveReload()
+    try:
+        watcher = CVWatcher(output_format=output_format, notify=livereload.notify)
+    except CVValidationError as error:
+        print("❌ CV inválido, nenhum arquivo foi gravado:")
+        for message in error.errors:
+            print(f"   - {message}")
+        return 1
+    if port:
+        serve(watcher.output_root, port, livereload)
+        print(f"🌐 Servindo em http://localhost:{port} com live reload")
+    watcher.run()
+    return 0
+
+def update_technologies(cv_data, output_root=".", manifest=None, changed=None, output_format=DEFAULT_FORMAT):
+    """Atualiza content/technologies.json (não depende do idioma)"""
+    
+    manifest = manifest or BuildManifest(output_root)
+    render = partial(render_technology_facets, today=reference_date())
+    _render_output(manifest, FACETS_FILE, render, cv_data, changed, output_format)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os JSON do site a partir do CV em PDF")
+    parser.add_argument("inputs", nargs="*", help="PDFs ou pastas de PDFs (modo batch)")
+    parser.add_argument("-o", "--output", nargs="+", default=["sites"],
+                        help="pasta raiz dos sites gerados, ou uma pasta por CV")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="ignora o cache e regrava todos os arquivos")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="processos no pool: um CV por processo no modo batch, "
+                             "um idioma por processo com um único CV (padrão: núcleos disponíveis no batch)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=DEFAULT_FORMAT, dest="output_format",
+                        help="formato dos JSON gerados: pretty (indentado), compact (sem espaços) "
+                             "ou minified (sem espaços, chaves ordenadas)")
+    parser.add_argument("--bundle-assets", action="store_true",
+                        help="junta e minifica o CSS e o JS do index.html em arquivos com hash (publicação)")
+    parser.add_argument("--assets-only", action="store_true",
+                        help="só gera os pacotes de CSS/JS e o precache do site atual, sem ler o CV "
+                             "nem regravar traduções e conteúdos")
+    parser.add_argument("-t", "--tenants", action="store_true",
+                        help="modo multi-tenant: as entradas são perfis (.json ou .pdf) e cada um vira um site "
+                             "completo em <saída>/<nome>/, com arquivos idênticos compartilhados em <saída>/.store")
+    parser.add_argument("-w", "--watch", action="store_true",
+                        help="continua rodando e regera a prévia em .preview/ quando cv.pdf ou o cv_data.json dela mudam")
+    parser.add_argument("--serve", type=int, metavar="PORTA",
+                        help="com --watch, serve o site nesta porta com live reload")
+    parser.add_argument("--profile", metavar="TRACE.json",
+                        help="mede cada etapa e grava um trace do Chrome (chrome://tracing, Perfetto)")
+    args = parser.parse_args(argv)
+    
+    if args.assets_only:
+        if args.inputs or args.watch or args.tenants:
+            parser.error("--assets-only trabalha só no site da pasta atual")
+        build_assets()
+        return 0
+    
+    # "Presente" nas facetas depende dela: falha antes de gerar qualquer site
+    try:
+        reference_date()
+    except ValueError as error:
+        parser.error(str(error))
+    
+    if args.watch:
+        if args.inputs:
+            parser.error("--watch funciona com um único CV (sem PDFs na linha de comando)")
+        if args.bundle_assets:
+            parser.error("--bundle-assets é para publicação; o --watch usa os arquivos originais")
+        return _watch(args.output_format, args.serve)
+    
+    if args.tenants:
+        if not args.inputs or len(args.output) != 1:
+            parser.error("--tenants precisa de perfis e de uma única pasta de saída")
+        try:
+            jobs = collect_tenant_jobs(args.inputs, args.output[0])
+        except ValueError as error:
+            parser.error(str(error))
+        store_root = Path(args.output[0]) / STORE_DIR
+        failures = batch_save_cv_data(jobs, args.workers, args.force, args.profile, args.output_format,
+                                      args.bundle_assets, store_root)
+        return 1 if failures else 0
+    
+    if not args.inputs:
+        profiler = Profiler(label=CV_PDF) if args.profile else None
+        try:
+            if args.workers and args.workers > 1:
+                with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                    save_cv_data(force=args.force, executor=executor, profiler=profiler,
+                                 output_format=args.output_format, bundle_assets=args.bundle_assets)
+            else:
+                save_cv_data(force=args.force, profiler=profiler, output_format=args.output_format,
+                             bundle_assets=args.bundle_assets)
+        except CVValidationError as error:
+            print("❌ CV inválido, nenhum arquivo foi gravado:")
+            for message in error.errors:
+                print(f"   - {message}")
+            return 1
+        if profiler:
+            _print_profile(profiler)
+            save_trace(args.profile, profiler.events)
+            print(f"📈 Trace salvo em {args.profile}")
+        return 0
+    
+    try:
+        jobs = collect_batch_jobs(args.inputs, args.output)
+    except ValueError as error:
+        parser.error(str(error))
+    failures = batch_save_cv_data(jobs, args.workers, args.force, args.profile, args.output_format,
+                                  args.bundle_assets)
+    return 1 if failures else 0
 
 if __name__ == "__main__":
-    save_cv_data()
+    sys.exit(main())
@@ -5,18 +5,31 @@
 
 class I18n {
     constructor() {
-        this.currentLang = this.getStoredLanguage() || this.getBrowserLanguage() || 'en';
+        // Set by the generator on index.<lang>.html pages rendered at build time
+        this.prerendered = document.documentElement.dataset.prerendered || null;
+        this.currentLang = this.prerendered || this.getStoredLanguage() || this.getBrowserLanguage() || 'en';
         this.translations = {};
+        this.projects = {};
+        this.bundles = null;
+        this.searchIndexes = {};
         this.init();
     }
 
     async init() {
+        if (this.prerendered) {
+            // Text and projects are already in the page: only hydrate language switching,
+            // translations are fetched when the user switches
+            this.bindEvents();
+            this.updateLanguageToggle();
+            return;
+        }
+
         try {
             // Load translations
             await this.loadTranslations();
 
             // Set initial language
-            this.setLanguage(this.currentLang);
+            await this.setLanguage(this.currentLang);
 
             // Bind events
             this.bindEvents();
@@ -29,6 +42,19 @@ class I18n {
     }
 
     async loadTranslations() {
+        // Prefer the per-language bundle (translations + projects in one request)
+        this.bundles = await this.getBundleMap();
+        if (this.bundles) {
+            try {
+                const lang = this.bundles[this.currentLang] ? this.currentLang : 'en';
+                await this.loadBundle(lang);
+                return;
+            } catch (error) {
+                console.error('Failed to load language bundle:', error);
+                this.bundles = null;
+            }
+        }
+
         try {
             const [enTranslations, ptTranslations] = await Promise.all([
                 fetch('i18n/en.json').then(res => res.json()),
@@ -46,6 +72,45 @@ class I18n {
         }
     }
 
+    async getBundleMap() {
+        // Map inlined in the page by the generator (empty = no bundles, use
+        // i18n/<lang>.json); only pages without it fetch i18n/bundles.json
+        const inline = document.getElementById('i18n-bundles');
+        try {
+            if (inline) return JSON.parse(inline.textContent || '{}');
+
+            const res = await fetch('i18n/bundles.json');
+            return res.ok ? await res.json() : null;
+        } catch (error) {
+            return null;
+        }
+    }
+
+    async loadBundle(lang) {
+        const file = this.bundles && this.bundles[lang];
+        if (!file) return;
+
+        const bundle = await fetch(file).then(res => res.json());
+        this.translations[lang] = bundle.translations;
+        this.projects[lang] = bundle.projects;
+    }
+
+    async loadLanguage(lang) {
+        if (!this.bundles) {
+            this.bundles = await this.getBundleMap();
+        }
+
+        try {
+            if (this.bundles && this.bundles[lang]) {
+                await this.loadBundle(lang);
+            } else {
+                this.translations[lang] = await fetch(`i18n/${lang}.json`).then(res => res.json());
+            }
+        } catch (error) {
+            console.error(`Failed to load ${lang} translations:`, error);
+        }
+    }
+
     getBrowserLanguage() {
         const lang = navigator.language || navigator.userLanguage;
         return lang.startsWith('pt') ? 'pt' : 'en';
@@ -55,7 +120,11 @@ class I18n {
         return localStorage.getItem('portfolio-language');
     }
 
-    setLanguage(lang) {
+    async setLanguage(lang) {
+        if (!this.translations[lang]) {
+            await this.loadLanguage(lang);
+        }
+
         if (!this.translations[lang]) {
             console.warn(`Language ${lang} not available`);
             return;
@@ -81,10 +150,8 @@ class I18n {
     }
 
     updateHreflang(lang) {
-        const currentUrl = window.location.origin + window.location.pathname;
-        const alternateUrl = lang === 'pt'
-            ? `${currentUrl}?lang=pt`
-            : currentUrl.replace('?lang=pt', '');
+        // Alternates point at the prerendered index.<lang>.html pages; the site root is x-default
+        const base = window.location.origin + window.location.pathname.replace(/index(\.[a-z]{2})?\.html$/, '');
 
         // Update or create hreflang links
         let hreflangEn = document.querySelector('link[hreflang="en"]');
@@ -112,9 +179,9 @@ class I18n {
             document.head.appendChild(hreflangDefault);
         }
 
-        hreflangEn.href = currentUrl.replace('?lang=pt', '');
-        hreflangPt.href = currentUrl.includes('?lang=pt') ? currentUrl : `${currentUrl}?lang=pt`;
-        hreflangDefault.href = currentUrl.replace('?lang=pt', '');
+        hreflangEn.href = `${base}index.en.html`;
+        hreflangPt.href = `${base}index.pt.html`;
+        hreflangDefault.href = base;
     }
 
     translateElements() {
@@ -163,6 +230,11 @@ class I18n {
     }
 
     async loadProjects(lang) {
+        if (this.projects[lang]) {
+            this.renderProjects(this.projects[lang]);
+            return;
+        }
+
         try {
             const projects = await fetch(`content/projects.${lang}.json`).then(res => res.json());
             this.renderProjects(projects);
@@ -189,12 +261,7 @@ class I18n {
 
         card.innerHTML = `
       <div class="project-card__image-container">
-        <img 
-          src="${project.images[0]}" 
-          alt="${project.title}" 
-          class="project-card__image"
-          loading="lazy"
-        >
+        ${this.createProjectPicture(project)}
       </div>
       <div class="project-card__content">
         <h3 class="project-card__title">${project.title}</h3>
@@ -218,6 +285,98 @@ class I18n {
         return card;
     }
 
+    createProjectPicture(project) {
+        // Responsive variants, intrinsic size and LQIP come from the generator (images.py)
+        const media = project.media && project.media[0];
+        if (!media) {
+            return `<img src="${project.images[0]}" alt="${project.title}" class="project-card__image" loading="lazy">`;
+        }
+
+        const sources = Object.entries(media.srcset).map(([type, srcset]) =>
+            `<source type="${type}" srcset="${srcset}" sizes="(min-width: 768px) 33vw, 100vw">`
+        ).join('');
+        const size = media.width ? ` width="${media.width}" height="${media.height}"` : '';
+        const lqip = media.lqip ? ` style="background-image:url(${media.lqip});background-size:cover"` : '';
+
+        return `<picture>${sources}<img src="${media.src}" alt="${project.title}" class="project-card__image" loading="lazy" decoding="async"${size}${lqip}></picture>`;
+    }
+
+    foldSearchText(text) {
+        // Same folding as search_index.fold in the generator: no accents, lower case
+        return text.normalize('NFKD').replace(/\p{M}/gu, '').toLowerCase();
+    }
+
+    tokenizeSearch(text) {
+        return (this.foldSearchText(text).match(/[\p{L}\p{N}]+/gu) || []).filter(term => term.length >= 2);
+    }
+
+    loadSearchIndex(lang = this.currentLang) {
+        // Fetched on the first search only; terms are mapped once for O(1) lookups
+        if (!this.searchIndexes[lang]) {
+            this.searchIndexes[lang] = fetch(`search/index.${lang}.json`)
+                .then(res => res.json())
+                .then(index => ({ ...index, positions: new Map(index.terms.map((term, i) => [term, i])) }));
+        }
+        return this.searchIndexes[lang];
+    }
+
+    searchTermPositions(index, term, prefix) {
+        if (!prefix) {
+            return index.positions.has(term) ? [index.positions.get(term)] : [];
+        }
+
+        // Terms sharing a prefix are contiguous in the sorted term list
+        let low = 0;
+        let high = index.terms.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (index.terms[mid] < term) low = mid + 1;
+            else high = mid;
+        }
+        const positions = [];
+        for (let i = low; i < index.terms.length && index.terms[i].startsWith(term); i++) {
+            positions.push(i);
+        }
+        return positions;
+    }
+
+    async search(query, lang = this.currentLang) {
+        // Every term must match; the last one also matches as a prefix (search-as-you-type)
+        const terms = this.tokenizeSearch(query);
+        if (!terms.length) return [];
+
+        const index = await this.loadSearchIndex(lang);
+        let totals = null;
+
+        terms.forEach((term, n) => {
+            const found = new Map();
+            this.searchTermPositions(index, term, n === terms.length - 1).forEach(position => {
+                const postings = index.postings[position];
+                let doc = 0;
+                for (let i = 0; i < postings.length; i += 2) {
+                    doc += postings[i];
+                    found.set(doc, Math.max(found.get(doc) || 0, postings[i + 1]));
+                }
+            });
+
+            if (totals === null) {
+                totals = found;
+            } else {
+                for (const [doc, score] of totals) {
+                    if (found.has(doc)) totals.set(doc, score + found.get(doc));
+                    else totals.delete(doc);
+                }
+            }
+        });
+
+        return [...totals]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .map(([doc, score]) => {
+                const [type, id, title] = index.docs[doc];
+                return { type, id, title, score };
+            });
+    }
+
     bindEvents() {
         const languageToggle = document.getElementById('language-toggle');
         if (languageToggle) {
@@ -239,6 +398,13 @@ window.addEventListener('load', () => {
     const urlParams = new URLSearchParams(window.location.search);
     const langParam = urlParams.get('lang');
 
+    // Old ?lang= links go to the prerendered page when the generator produced one
+    const pages = (document.documentElement.dataset.pages || '').split(' ');
+    if (langParam && pages.includes(langParam)) {
+        window.location.replace(`index.${langParam}.html${window.location.hash}`);
+        return;
+    }
+
     if (langParam && ['en', 'pt'].includes(langParam) && window.i18n) {
         window.i18n.setLanguage(langParam);
     }
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Otimização das imagens de projetos e do perfil.
+
+Para cada imagem gera variantes AVIF/WebP em várias larguras, registra as
+dimensões intrínsecas e um placeholder LQIP (data URI minúsculo). O
+resultado vai para images/optimized/ e os metadados para
+images/optimized/images.json, usados em content/projects.*.json e no
+<picture> da foto de perfil das páginas pré-renderizadas. Todas as URLs
+são relativas, para o site funcionar em um subcaminho (/portifolio/).
+
+O Pillow é opcional: sem ele (ou para SVGs) só as dimensões são
+registradas. Imagens cujo hash não mudou não são recodificadas.
+"""
+
+import base64
+import io
+import json
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import LRUCache, sha256_file
+from bundles import read_json
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # opcional: sem Pillow não há variantes
+    Image = None
+
+# Raiz de onde vêm as imagens referenciadas pelo CV (/projects/..., images/...)
+SOURCE_ROOT = Path(__file__).parent.parent
+PROFILE_IMAGE = "images/profile.jpg"
+OUTPUT_DIR = "images/optimized"
+METADATA_FILE = f"{OUTPUT_DIR}/images.json"
+
+WIDTHS = (320, 640, 960, 1280)
+FORMATS = {"avif": {"quality": 50}, "webp": {"quality": 75, "method": 6}}
+LQIP_WIDTH = 16
+
+# Imagens já codificadas neste processo, por (caminho, "hash:formatos"): no modo
+# multi-tenant os sites que usam a mesma imagem não a recodificam. Limitado,
+# já que guarda os bytes de todas as variantes
+_ENCODED = LRUCache(maxsize=64)
+
+_SVG_SIZE_RE = re.compile(rb'<svg[^>]*?\bwidth="([\d.]+)(?:px)?"[^>]*?\bheight="([\d.]+)(?:px)?"', re.S)
+
+def supported_formats():
+    if Image is None:
+        return []
+    return [name for name in FORMATS if features.check(name)]
+
+def _sniff_size(path):
+    """Dimensões lidas só do cabeçalho (PNG, JPEG, SVG), sem o Pillow"""
+    with open(path, "rb") as f:
+        head = f.read(64 * 1024)
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png", int.from_bytes(head[16:20], "big"), int.from_bytes(head[20:24], "big")
+    if head.startswith(b"\xff\xd8"):
+        i = 2
+        while i + 9 < len(head):
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            length = int.from_bytes(head[i + 2:i + 4], "big")
+            if marker in (0xC0, 0xC1, 0xC2, 0xC3):
+                return "jpeg", int.from_bytes(head[i + 7:i + 9], "big"), int.from_bytes(head[i + 5:i + 7], "big")
+            i += 2 + length
+        return "jpeg", None, None
+    match = _SVG_SIZE_RE.search(head)
+    if match or b"<svg" in head[:1024]:
+        if match:
+            return "svg", round(float(match.group(1))), round(float(match.group(2)))
+        return "svg", None, None
+    return None, None, None
+
+def _relative_source(src):
+    return src.lstrip("/")
+
+def _stem(relative):
+    return re.sub(r"[^a-zA-Z0-9]+", "-", relative.rsplit(".", 1)[0]).strip("-")
+
+def encode_image(relative, formats):
+    """
+    Codifica todas as variantes de uma imagem (roda em um processo do pool).
+    Retorna (metadados, {caminho de saída: bytes}).
+    """
+    path = SOURCE_ROOT / relative
+    kind, width, height = _sniff_size(path)
+    meta = {"src": relative, "width": width, "height": height, "srcset": {}}
+    files = {}
+    if kind == "svg" or Image is None or not formats:
+        return _sorted_meta(meta), files
+
+    with Image.open(path) as image:
+        image.load()
+    # Fotos de câmera/celular guardam a rotação só no EXIF
+    image = ImageOps.exif_transpose(image)
+    meta["width"], meta["height"] = image.size
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    widths = [w for w in WIDTHS if w < image.width] + [image.width]
+    stem = _stem(relative)
+    for fmt in formats:
+        entries = []
+        for width in widths:
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, fmt.upper(), **FORMATS[fmt])
+            output = f"{OUTPUT_DIR}/{stem}-{width}.{fmt}"
+            files[output] = buffer.getvalue()
+            entries.append(f"{output} {width}w")
+        meta["srcset"][f"image/{fmt}"] = ", ".join(entries)
+
+    # LQIP: versão de 16px embutida como data URI, mostrada enquanto carrega
+    tiny = image.resize((LQIP_WIDTH, max(1, round(image.height * LQIP_WIDTH / image.width))))
+    buffer = io.BytesIO()
+    lqip_format = "webp" if "webp" in formats else "jpeg"
+    tiny.convert("RGB").save(buffer, lqip_format.upper(), quality=30)
+    meta["lqip"] = f"data:image/{lqip_format};base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    return _sorted_meta(meta), files
+
+def _sorted_meta(meta):
+    """
+    Chaves na ordem do images.json relido (sort_keys): os metadados de uma
+    imagem recém-codificada e os reaproveitados geram a mesma saída.
+    """
+    meta["srcset"] = dict(sorted(meta["srcset"].items()))
+    return dict(sorted(meta.items()))
+
+def collect_image_sources(cv_data):
+    """Imagens dos projetos mais a foto de perfil, sem repetição"""
+    sources = [PROFILE_IMAGE]
+    for project in cv_data.projects:
+        sources.extend(_relative_source(src) for src in project.images)
+    return [src for src in dict.fromkeys(sources) if (SOURCE_ROOT / src).is_file()]
+
+def _input_digest(relative, formats):
+    return f"{sha256_file(SOURCE_ROOT / relative)}:{','.join(formats)}"
+
+def images_stale(manifest):
+    """Alguma imagem de origem (ou os formatos disponíveis) mudou desde a última execução?"""
+    formats = supported_formats()
+    for name, digest in manifest.inputs.items():
+        if not name.startswith("image:"):
+            continue
+        try:
+            if _input_digest(name.partition(":")[2], formats) != digest:
+                return True
+        except OSError:
+            return True
+    return False
+
+def optimize_images(manifest, sources, executor=None):
+    """
+    Gera as variantes das imagens que mudaram e grava images.json.
+    Retorna (metadados por src, True se algum metadado mudou).
+
+    A codificação é distribuída entre os núcleos: usa o executor recebido
+    ou um ProcessPoolExecutor próprio, exceto quando já estamos dentro de
+    um processo do pool do modo batch (aí roda em série).
+    """
+    formats = supported_formats()
+    previous = read_json(manifest.root / METADATA_FILE) or {}
+    metadata = {}
+    pending = []
+    for relative in sources:
+        old = previous.get(relative)
+        input_digest = _input_digest(relative, formats)
+        changed = manifest.track_input(f"image:{relative}", input_digest)
+        variants = _variant_paths(old)
+        encoded = _ENCODED.get((relative, input_digest))
+        if old and not changed and all(manifest.is_fresh(path) for path in variants):
+            metadata[relative] = old
+            manifest.skipped.extend(variants)
+        elif encoded is not None:
+            meta, files = encoded
+            metadata[relative] = meta
+            for path, payload in files.items():
+                manifest.write(path, payload)
+        else:
+            pending.append((relative, input_digest))
+
+    if pending:
+        jobs = [(relative, formats) for relative, _digest in pending]
+        own_pool = executor is None and len(pending) > 1 and multiprocessing.parent_process() is None
+        if own_pool:
+            executor = ProcessPoolExecutor()
+        try:
+            mapper = executor.map if executor else map
+            for source, (meta, files) in zip(pending, mapper(_encode_job, jobs)):
+                _ENCODED.put(source, (meta, files))
+                metadata[meta["src"]] = meta
+                for path, payload in files.items():
+                    manifest.write(path, payload)
+        finally:
+            if own_pool:
+                executor.shutdown()
+
+    # Imagens que saíram do CV
+    for name in list(manifest.inputs):
+        if name.startswith("image:") and name.partition(":")[2] not in sources:
+            del manifest.inputs[name]
+
+    # Variantes de imagens que saíram do CV
+    kept = {path for meta in metadata.values() for path in _variant_paths(meta)}
+    for meta in previous.values():
+        for path in _variant_paths(meta):
+            if path not in kept:
+                manifest.remove(path)
+
+    payload = json.dumps(metadata, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+    return metadata, manifest.write(METADATA_FILE, payload)
+
+def _encode_job(job):
+    return encode_image(*job)
+
+def _variant_paths(meta):
+    if not meta:
+        return []
+    return [
+        entry.split(" ")[0].lstrip("/")
+        for srcset in meta.get("srcset", {}).values()
+        for entry in srcset.split(", ")
+    ]
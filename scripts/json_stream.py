@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Codificação de JSON em partes, nos formatos de saída do gerador.
+
+- pretty: indentado com 2 espaços (o formato histórico, legível)
+- compact: sem espaços, na ordem original das chaves
+- minified: sem espaços e com as chaves ordenadas (melhor para gzip/brotli)
+
+iter_json percorre dicionários, listas, geradores e registros (cv_model)
+emitindo um item por vez; cada item é codificado pelo json da biblioteca
+padrão. Assim um array grande (projetos, experiências) vai para o disco
+aos poucos, sem montar o arquivo inteiro na memória.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from types import GeneratorType
+
+from dependency_graph import unwrap
+
+OUTPUT_FORMATS = ("pretty", "compact", "minified")
+DEFAULT_FORMAT = "pretty"
+INDENT = "  "
+
+@lru_cache(maxsize=None)
+def _encoder(output_format):
+    if output_format == "pretty":
+        return json.JSONEncoder(ensure_ascii=False, indent=2, default=unwrap)
+    if output_format in ("compact", "minified"):
+        return json.JSONEncoder(
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=output_format == "minified",
+            default=unwrap,
+        )
+    raise ValueError(f"Formato de saída desconhecido: {output_format}")
+
+def _streamable(value):
+    return isinstance(value, (dict, list, GeneratorType)) or (is_dataclass(value) and not isinstance(value, type))
+
+def iter_json(value, output_format=DEFAULT_FORMAT, level=0):
+    """
+    Gera o JSON de value em partes (str). O resultado concatenado é igual
+    ao de json.dumps com as opções do formato.
+    """
+    encoder = _encoder(output_format)
+    pretty = output_format == "pretty"
+
+    if not _streamable(value):
+        chunk = encoder.encode(value)
+        # Em JSON as quebras de linha só aparecem na indentação
+        yield chunk.replace("\n", "\n" + INDENT * level) if pretty and level else chunk
+        return
+
+    if isinstance(value, dict) or is_dataclass(value):
+        if isinstance(value, dict):
+            items = value.items()
+        else:
+            items = ((f.name, getattr(value, f.name)) for f in fields(value))
+        if output_format == "minified":
+            items = sorted(items, key=lambda item: item[0])
+        opening, closing = "{", "}"
+    else:
+        items = ((None, item) for item in value)
+        opening, closing = "[", "]"
+
+    separator = ",\n" + INDENT * (level + 1) if pretty else ","
+    key_separator = ": " if pretty else ":"
+    empty = True
+    for key, item in items:
+        if empty:
+            yield opening + ("\n" + INDENT * (level + 1) if pretty else "")
+            empty = False
+        else:
+            yield separator
+        if key is not None:
+            yield encoder.encode(key) + key_separator
+        yield from iter_json(item, output_format, level + 1)
+    if empty:
+        yield opening + closing
+    else:
+        yield ("\n" + INDENT * level if pretty else "") + closing
+
+def iter_json_bytes(value, output_format=DEFAULT_FORMAT, buffer_size=64 * 1024):
+    """iter_json agrupado em blocos de bytes UTF-8 de ~buffer_size"""
+    parts = []
+    size = 0
+    for chunk in iter_json(value, output_format):
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            yield "".join(parts).encode("utf-8")
+            parts.clear()
+            size = 0
+    if parts:
+        yield "".join(parts).encode("utf-8")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Renderizador de idiomas a partir de um template compartilhado.
+
+scripts/locales/template.json descreve a estrutura de i18n/<lang>.json uma
+única vez. Cada folha do template é um texto fixo, um valor do CV
+("{{personal_info.name}}") ou uma entrada do catálogo do idioma
+("{{t:nav.home}}"). Cada scripts/locales/<lang>.json é o catálogo de um
+idioma: adicionar um idioma é só adicionar a tabela de textos dele.
+"""
+
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache, partial
+from pathlib import Path
+
+from build_cache import atomic_write_bytes
+from cv_model import lookup
+
+# CV_LOCALES_DIR aponta para outro conjunto de catálogos (ex.: benchmark)
+LOCALES_DIR = Path(os.environ.get("CV_LOCALES_DIR") or Path(__file__).parent / "locales")
+TEMPLATE_NAME = "template.json"
+DEFAULT_LOCALE = "en"
+
+# Template compilado fica junto dos .pyc, fora do controle de versão
+COMPILED_CACHE = Path(__file__).parent / "__pycache__" / "locale-template.json"
+COMPILED_VERSION = 1
+
+_PLACEHOLDER_RE = re.compile(r"^\{\{\s*(t:)?([^{}]+?)\s*\}\}$")
+
+# Tipos de folha do template compilado
+LITERAL, CATALOG, CV_VALUE = 0, 1, 2
+
+def _split_path(ref):
+    """'experience.0.highlights' -> ('experience', 0, 'highlights')"""
+    return tuple(int(part) if part.isdigit() else part for part in ref.split("."))
+
+def compile_template(template):
+    """
+    Achata o template em uma lista de operações (caminho de saída, tipo,
+    referência), na ordem em que as chaves aparecem.
+    """
+    ops = []
+    stack = [((), template)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (key,), value) for key, value in reversed(node.items()))
+            continue
+        match = _PLACEHOLDER_RE.match(node) if isinstance(node, str) else None
+        if not match:
+            ops.append((path, LITERAL, node))
+        elif match.group(1):
+            ops.append((path, CATALOG, _split_path(match.group(2))))
+        else:
+            ops.append((path, CV_VALUE, _split_path(match.group(2))))
+    return ops
+
+def load_compiled_template(path):
+    """
+    Template compilado, reaproveitado do cache em disco enquanto o
+    template.json não mudar.
+    """
+    source = Path(path).read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    try:
+        with open(COMPILED_CACHE, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == COMPILED_VERSION and cached.get("sha256") == digest:
+            return [(tuple(out), kind, tuple(ref) if kind else ref) for out, kind, ref in cached["ops"]]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    ops = compile_template(json.loads(source))
+    payload = json.dumps({"version": COMPILED_VERSION, "sha256": digest, "ops": ops}, ensure_ascii=False)
+    try:
+        # Atômico: outro processo (batch, watch) nunca lê um cache pela metade
+        atomic_write_bytes(COMPILED_CACHE, payload.encode("utf-8"))
+    except OSError:
+        pass
+    return ops
+
+def _lookup(data, path):
+    for key in path:
+        data = data[key]
+    return data
+
+def _catalog_text(catalogs, locale, key):
+    """Texto do catálogo do idioma, com fallback para o idioma padrão"""
+    for candidate in (locale, DEFAULT_LOCALE):
+        try:
+            return _lookup(catalogs[candidate], key)
+        except (KeyError, IndexError, TypeError):
+            continue
+    return ".".join(map(str, key))
+
+def _fill(ops, values, catalogs, locale):
+    """Monta o dicionário de um idioma a partir dos valores já resolvidos"""
+    result = {}
+    slot = 0
+    for path, kind, ref in ops:
+        if kind == CV_VALUE:
+            value = values[slot]
+            slot += 1
+        elif kind == CATALOG:
+            value = _catalog_text(catalogs, locale, ref)
+        else:
+            value = ref
+        node = result
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return locale, result
+
+class LocaleRenderer:
+    """Template compilado mais os catálogos de todos os idiomas"""
+
+    def __init__(self, ops, catalogs):
+        self.ops = ops
+        self.catalogs = catalogs
+
+    @property
+    def locales(self):
+        return list(self.catalogs)
+
+    def text(self, locale, key):
+        return _catalog_text(self.catalogs, locale, _split_path(key))
+
+    def resolve_values(self, cv_data):
+        """
+        Lê de cv_data cada valor usado pelo template, uma única vez para
+        todos os idiomas. Itens ausentes (ex.: menos de três highlights)
+        viram texto vazio.
+        """
+        values = []
+        for _path, kind, ref in self.ops:
+            if kind != CV_VALUE:
+                continue
+            try:
+                values.append(lookup(cv_data, ref))
+            except (KeyError, IndexError, AttributeError, TypeError):
+                values.append("")
+        return values
+
+    def render(self, cv_data, locales=None, executor=None):
+        """
+        Renderiza as traduções dos idiomas pedidos (padrão: todos) em uma
+        passada. Com um executor (ex.: ProcessPoolExecutor) os idiomas são
+        montados em paralelo; os valores do CV são resolvidos antes, aqui.
+        """
+        locales = self.locales if locales is None else list(locales)
+        values = self.resolve_values(cv_data)
+        fill = partial(_fill, self.ops, values, self.catalogs)
+        results = executor.map(fill, locales) if executor else map(fill, locales)
+        return dict(results)
+
+    def iter_projects(self, cv_data, locale, media=None):
+        """
+        Projetos de um idioma, um por vez; títulos e descrições vêm do
+        catálogo se houver. media (de images.optimize_images) acrescenta
+        srcset, dimensões e placeholder de cada imagem.
+        """
+        catalog = self.catalogs.get(locale, {}).get("projects", {})
+        titles = catalog.get("titles", {})
+        descriptions = catalog.get("descriptions", {})
+        for project in cv_data.projects:
+            rendered = {
+                "id": project.id,
+                "title": titles.get(project.id) or project.title,
+                "description": descriptions.get(project.id) or project.description,
+                "technologies": project.technologies,
+                "images": project.images,
+                "liveUrl": project.liveUrl,
+                "repoUrl": project.repoUrl,
+                "featured": project.featured
+            }
+            if media is not None:
+                sources = [src.lstrip("/") for src in project.images]
+                rendered["media"] = [media[src] for src in sources if src in media]
+            yield rendered
+
+def locale_files(locales_dir=LOCALES_DIR):
+    """Template e catálogos; o idioma padrão vem primeiro"""
+    catalogs = sorted(
+        (path for path in Path(locales_dir).glob("*.json") if path.name != TEMPLATE_NAME),
+        key=lambda path: (path.stem != DEFAULT_LOCALE, path.stem),
+    )
+    return Path(locales_dir) / TEMPLATE_NAME, catalogs
+
+@lru_cache(maxsize=None)
+def load_locale_renderer(locales_dir=LOCALES_DIR):
+    """Carrega (uma vez por processo) o template compilado e os catálogos"""
+    template_path, catalog_paths = locale_files(locales_dir)
+    catalogs = {}
+    for path in catalog_paths:
+        with open(path, encoding="utf-8") as f:
+            catalogs[path.stem] = json.load(f)
+    return LocaleRenderer(load_compiled_template(template_path), catalogs)
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Pré-renderização do index.html traduzido.
+
+O index.html é compilado uma vez em uma lista de trechos fixos e lacunas
+(conteúdo de elementos com data-i18n, o atributo lang do <html>, o grid de
+projetos e as <img> com variantes otimizadas, como a foto de perfil). Todos os idiomas são então montados em uma única passada sobre
+essa lista, gerando index.<lang>.html já com o texto e os cards de projeto,
+sem depender do JavaScript para o primeiro paint. O index.html do
+repositório é só o template e nunca é regravado: em outro diretório de
+saída, o index.html é montado no idioma padrão, com links hreflang para as
+páginas traduzidas, e o sitemap.xml lista todas elas.
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+
+from build_cache import sha256_bytes, sha256_file
+from bundles import read_json
+from images import METADATA_FILE
+from locale_renderer import DEFAULT_LOCALE
+
+# Template das páginas (somente leitura)
+SITE_TEMPLATE = Path(__file__).parent.parent / "index.html"
+TEMPLATE_INPUT = "template:source"
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}
+
+_LANG_ATTR_RE = re.compile(r"""\blang\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+)""")
+_ALTERNATE_RE = re.compile(r"""[ \t]*<link\s+rel=["']alternate["']\s+hreflang=[^>]*>[ \t]*\n?""")
+_HREF_RE = re.compile(r"""href=["']([^"']*)["']""")
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>")
+_SRC_ATTR_RE = re.compile(r"""\ssrc\s*=\s*["']([^"']*)["']""")
+_SIZES_ATTR_RE = re.compile(r"""\ssizes\s*=\s*["']([^"']*)["']""")
+_SIZE_ATTRS_RE = re.compile(r"""\s(?:width|height|decoding)\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+)""")
+_OG_URL_RE = re.compile(r"""<meta\s+property=["']og:url["']\s+content=["']([^"']*)["']""")
+
+SITEMAP = "sitemap.xml"
+
+# Tipos de lacuna
+TEXT, HTML_LANG, PROJECTS, IMAGE = "text", "lang", "projects", "image"
+
+class _SlotFinder(HTMLParser):
+    """Localiza (início, fim, tipo, chave) de cada lacuna no HTML"""
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=False)
+        self.html = html
+        self.line_offsets = [0]
+        for line in html.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.stack = []
+        self.slots = []
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        tag_text = self.get_starttag_text()
+        end = start + len(tag_text)
+        attrs = dict(attrs)
+        if tag == "html":
+            # Substitui o atributo lang dentro da própria tag
+            match = _LANG_ATTR_RE.search(tag_text)
+            if match:
+                self.slots.append((start + match.start(), start + match.end(), HTML_LANG, None))
+        if tag == "img" and attrs.get("src") and not any(entry[0] == "picture" for entry in self.stack):
+            self.slots.append((start, end, IMAGE, None))
+        if tag in VOID_ELEMENTS:
+            return
+        slot = None
+        if "data-i18n" in attrs:
+            slot = (TEXT, attrs["data-i18n"])
+        elif attrs.get("id") == "projects-grid":
+            slot = (PROJECTS, None)
+        self.stack.append((tag, end, slot))
+
+    def handle_endtag(self, tag):
+        end_tag_at = self._offset()
+        while self.stack:
+            open_tag, content_start, slot = self.stack.pop()
+            if slot:
+                self.slots.append((content_start, end_tag_at, slot[0], slot[1]))
+            if open_tag == tag:
+                break
+
+@lru_cache(maxsize=8)
+def compile_page(html):
+    """
+    Divide o HTML em segmentos: strings fixas e tuplas (tipo, chave,
+    conteúdo original) para as lacunas. Fica em cache por processo, já que
+    no modo batch todos os sites usam o mesmo template.
+    """
+    finder = _SlotFinder(html)
+    finder.feed(html)
+    finder.close()
+
+    segments = []
+    cursor = 0
+    # Lacunas aninhadas (ex.: data-i18n dentro do grid) ficam com a externa
+    for start, end, kind, key in sorted(finder.slots):
+        if start < cursor:
+            continue
+        segments.append(html[cursor:start])
+        segments.append((kind, key, html[start:end]))
+        cursor = end
+    segments.append(html[cursor:])
+    return tuple(segments)
+
+def _lookup(translations, key):
+    value = translations
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value if isinstance(value, str) else None
+
+def _render_text(original, text):
+    """
+    Conteúdo traduzido de um elemento data-i18n: troca só o texto final
+    (ícones e outras tags antes dele ficam) e mantém os espaços e quebras
+    de linha do template.
+    """
+    markup_end = original.rfind(">") + 1
+    markup, content = original[:markup_end], original[markup_end:]
+    stripped = content.strip()
+    if " ".join(stripped.split()) == text:
+        return original
+    leading = content[: len(content) - len(content.lstrip())]
+    trailing = content[len(content.rstrip()):]
+    return markup + leading + escape(text, quote=False) + trailing
+
+def _project_picture(project, title):
+    """<img> do card; com metadados de images.py vira <picture> com srcset e LQIP"""
+    media = (project.get("media") or [None])[0]
+    src = escape(project["images"][0]) if project["images"] else ""
+    if not media:
+        return f'<img src="{src}" alt="{title}" class="project-card__image" loading="lazy">'
+    src = escape(media["src"])
+
+    sources = "".join(
+        f'<source type="{escape(mime)}" srcset="{escape(srcset)}" sizes="(min-width: 768px) 33vw, 100vw">'
+        for mime, srcset in media["srcset"].items()
+    )
+    size = f' width="{media["width"]}" height="{media["height"]}"' if media["width"] else ""
+    lqip = f' style="background-image:url({escape(media["lqip"])});background-size:cover"' if media.get("lqip") else ""
+    return (
+        f'<picture>{sources}'
+        f'<img src="{src}" alt="{title}" class="project-card__image" loading="lazy" decoding="async"{size}{lqip}>'
+        f'</picture>'
+    )
+
+def render_picture(original, media):
+    """<img> do template dentro de um <picture> com as variantes de images.py"""
+    img = _IMG_TAG_RE.search(original)
+    src = _SRC_ATTR_RE.search(img.group(0)) if img else None
+    if not src:
+        return original
+    meta = media.get(src.group(1).lstrip("./"))
+    if not meta or not meta.get("srcset"):
+        return original
+
+    tag = _SIZE_ATTRS_RE.sub("", img.group(0))
+    sizes = _SIZES_ATTR_RE.search(tag)
+    sizes = sizes.group(1) if sizes else "100vw"
+    sources = "".join(
+        f'<source type="{escape(mime)}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">'
+        for mime, srcset in meta["srcset"].items()
+    )
+    size = f' width="{meta["width"]}" height="{meta["height"]}"' if meta["width"] else ""
+    tag = re.sub(r"\s*/?>$", f' decoding="async"{size}>', tag)
+    return f"<picture>{sources}{tag}</picture>"
+
+def render_project_cards(projects, translations):
+    """Mesma marcação de I18n.createProjectCard em scripts/i18n.js"""
+    view_live = escape(_lookup(translations, "projects.viewLive") or "")
+    view_repo = escape(_lookup(translations, "projects.viewRepo") or "")
+    cards = []
+    for project in projects:
+        title = escape(project["title"])
+        technologies = "".join(
+            f'<span class="project-card__tech">{escape(tech)}</span>' for tech in project["technologies"]
+        )
+        cards.append(
+            f'\n<article class="project-card">'
+            f'<div class="project-card__image-container">{_project_picture(project, title)}</div>'
+            f'<div class="project-card__content">'
+            f'<h3 class="project-card__title">{title}</h3>'
+            f'<p class="project-card__description">{escape(project["description"])}</p>'
+            f'<div class="project-card__technologies">{technologies}</div>'
+            f'<div class="project-card__actions">'
+            f'<a href="{escape(project["liveUrl"])}" class="project-card__link" target="_blank" rel="noopener">{view_live}</a>'
+            f'<a href="{escape(project["repoUrl"])}" class="project-card__link project-card__link--secondary" '
+            f'target="_blank" rel="noopener">{view_repo}</a>'
+            f'</div></div></article>'
+        )
+    return "".join(cards) + "\n"
+
+def render_pages(segments, pages, media=None):
+    """
+    Monta todas as páginas em uma passada sobre os segmentos.
+
+    pages: {nome: (html_lang, atributos extras do <html>, translations,
+    projects)}; media são os metadados de images.py. Retorna {nome: html}.
+    """
+    media = media or {}
+    outputs = {page: [] for page in pages}
+    for segment in segments:
+        if isinstance(segment, str):
+            for parts in outputs.values():
+                parts.append(segment)
+            continue
+        kind, key, original = segment
+        if kind == IMAGE:
+            value = render_picture(original, media)
+            for parts in outputs.values():
+                parts.append(value)
+            continue
+        for page, (html_lang, attributes, translations, projects) in pages.items():
+            if kind == HTML_LANG:
+                value = f'lang="{escape(html_lang)}"' + "".join(
+                    f' data-{name}="{escape(value)}"' for name, value in attributes.items()
+                )
+            elif kind == PROJECTS:
+                value = render_project_cards(projects, translations)
+            else:
+                text = _lookup(translations, key)
+                value = _render_text(original, text) if text is not None else original
+            outputs[page].append(value)
+    return {page: "".join(parts) for page, parts in outputs.items()}
+
+def site_url(html):
+    """URL pública do site: o hreflang x-default do template ou o og:url"""
+    for link in _ALTERNATE_RE.findall(html):
+        if "x-default" in link:
+            match = _HREF_RE.search(link)
+            if match:
+                return match.group(1)
+    match = _OG_URL_RE.search(html)
+    return match.group(1) if match else ""
+
+def _meta_re(name):
+    return re.compile(
+        rf"""([ \t]*<meta\s+(?:name|property)=["']{re.escape(name)}["']\s+content=["'])([^"']*)(["']\s*/?>[ \t]*\n?)"""
+    )
+
+_TEXT_META = ("description", "author", "og:title", "og:description", "twitter:title", "twitter:description")
+_URL_META = ("og:url", "twitter:url", "og:image", "twitter:image")
+
+def page_title(translations):
+    """meta.title das traduções ou "nome - título" do perfil"""
+    title = _lookup(translations, "meta.title")
+    if title is not None:
+        return title
+    hero = translations.get("hero") or {}
+    return " - ".join(part for part in (hero.get("name"), hero.get("headline")) if part)
+
+def with_profile_meta(html, translations, base):
+    """
+    Troca os metadados do <head> do template (descrição, autor, Open Graph e
+    Twitter) pelos do perfil. As URLs passam a usar base; sem ela, essas
+    tags e os links hreflang saem da página.
+    """
+    template_base = site_url(html)
+    hero = translations.get("hero") or {}
+    title = page_title(translations)
+    values = {
+        "description": hero.get("description", ""),
+        "author": hero.get("name", ""),
+        "og:title": title,
+        "twitter:title": title,
+    }
+    values["og:description"] = values["twitter:description"] = values["description"]
+    for name in _TEXT_META:
+        html = _meta_re(name).sub(lambda m: m.group(1) + escape(values[name]) + m.group(3), html)
+
+    def url(match):
+        content = match.group(2)
+        if not base or not template_base or not content.startswith(template_base):
+            return ""
+        return match.group(1) + escape(base + content[len(template_base):]) + match.group(3)
+
+    for name in _URL_META:
+        html = _meta_re(name).sub(url, html)
+    return html if base else _ALTERNATE_RE.sub("", html)
+
+def with_alternates(html, base, locales):
+    """Troca os links hreflang do template pelos das páginas index.<lang>.html"""
+    links = [(locale, f"{base}index.{locale}.html") for locale in locales] + [("x-default", base)]
+    first = _ALTERNATE_RE.search(html)
+    if first:
+        indent = first.group(0)[: len(first.group(0)) - len(first.group(0).lstrip())]
+        at = first.start()
+        html = _ALTERNATE_RE.sub("", html)
+    else:
+        indent = "    "
+        at = html.find("</head>")
+        if at < 0:
+            return html
+    block = "".join(
+        f'{indent}<link rel="alternate" hreflang="{escape(lang)}" href="{escape(href)}">\n' for lang, href in links
+    )
+    return html[:at] + block + html[at:]
+
+def render_sitemap(base, locales):
+    """sitemap.xml com a raiz e cada index.<lang>.html, todos com os alternates"""
+    alternates = "".join(
+        f'\n    <xhtml:link rel="alternate" hreflang="{escape(lang)}" href="{escape(href)}"/>'
+        for lang, href in [(locale, f"{base}index.{locale}.html") for locale in locales] + [("x-default", base)]
+    )
+    urls = "".join(
+        f"\n  <url>\n    <loc>{escape(loc)}</loc>{alternates}\n  </url>"
+        for loc in [base] + [f"{base}index.{locale}.html" for locale in locales]
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
+        '        xmlns:xhtml="http://www.w3.org/1999/xhtml">'
+        f"{urls}\n</urlset>\n"
+    )
+
+def read_template(manifest):
+    """HTML do template do site (registrado como entrada), ou None se ele não existe"""
+    try:
+        payload = SITE_TEMPLATE.read_bytes()
+    except OSError:
+        return None
+    manifest.track_input(TEMPLATE_INPUT, sha256_bytes(payload))
+    return payload.decode("utf-8")
+
+def template_stale(manifest):
+    """O template mudou desde a última execução?"""
+    try:
+        return manifest.inputs.get(TEMPLATE_INPUT) != sha256_file(SITE_TEMPLATE)
+    except OSError:
+        return False
+
+def is_template_root(root):
+    """O diretório de saída é o do próprio template (o repositório)?"""
+    return Path(root).resolve() == SITE_TEMPLATE.parent.resolve()
+
+def update_pages(manifest, renderer, html, website=""):
+    """
+    Gera index.<lang>.html para todos os idiomas a partir do html do
+    template (já com os pacotes embutidos) quando ele ou as
+    traduções/projetos de algum idioma mudaram nesta execução. Fora do
+    diretório do template, gera também o index.html no idioma padrão e o
+    sitemap.xml; no repositório eles são arquivos versionados e ficam como
+    estão.
+
+    website é a URL pública do perfil (personal_info.website). Fora do
+    repositório ela substitui a do template, assim como o título e os
+    metadados do <head>: um site gerado não herda os dados do dono do
+    template.
+    """
+    root = manifest.root
+    template_root = is_template_root(root)
+    base = site_url(html) if template_root else website
+    if base and not base.endswith("/"):
+        base += "/"
+    template_changed = manifest.track_input("template:index.html", sha256_bytes(html.encode("utf-8")))
+    template_changed |= manifest.track_input("template:base", base)
+    pages = {locale: f"index.{locale}.html" for locale in renderer.locales}
+    outputs = list(pages.values())
+    if not template_root:
+        # O sitemap exige URLs absolutas
+        outputs += ["index.html"] + ([SITEMAP] if "://" in base else [])
+    else:
+        # Versionados no repositório: não são saídas do build
+        for relative in ("index.html", SITEMAP):
+            manifest.outputs.pop(relative, None)
+    sources = {
+        source
+        for locale in renderer.locales
+        for source in (f"i18n/{locale}.json", f"content/projects.{locale}.json")
+    } | {METADATA_FILE}
+    if (
+        not template_changed
+        and not sources & set(manifest.written)
+        and all(manifest.is_fresh(page) for page in outputs)
+    ):
+        manifest.skipped.extend(outputs)
+        return
+
+    locales = {}
+    for locale in renderer.locales:
+        translations = read_json(root / f"i18n/{locale}.json")
+        projects = read_json(root / f"content/projects.{locale}.json")
+        if translations is None or projects is None:
+            continue
+        if not template_root and _lookup(translations, "meta.title") is None:
+            translations = {**translations, "meta": {**translations.get("meta", {}), "title": page_title(translations)}}
+        locales[locale] = (renderer.text(locale, "locale.htmlLang"), translations, projects)
+
+    if DEFAULT_LOCALE not in locales:
+        return
+    rendered = {
+        pages[locale]: (html_lang, {"prerendered": locale}, translations, projects)
+        for locale, (html_lang, translations, projects) in locales.items()
+    }
+    if "index.html" in outputs:
+        # Sem data-prerendered: o i18n.js ainda aplica o idioma salvo/do navegador
+        html_lang, translations, projects = locales[DEFAULT_LOCALE]
+        rendered["index.html"] = (html_lang, {"pages": " ".join(locales)}, translations, projects)
+
+    if not template_root:
+        html = with_profile_meta(html, locales[DEFAULT_LOCALE][1], base)
+    if base:
+        html = with_alternates(html, base, locales)
+    media = read_json(root / METADATA_FILE) or {}
+    for page, content in render_pages(compile_page(html), rendered, media).items():
+        manifest.write(page, content.encode("utf-8"))
+    if SITEMAP in outputs:
+        manifest.write(SITEMAP, render_sitemap(base, locales).encode("utf-8"))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Instrumentação por etapa do gerador.
+
+Profiler mede cada etapa de save_cv_data (extract, validate, translations,
+projects, write...): tempo, memória alocada (tracemalloc), bytes gravados
+e acertos/falhas do cache do manifesto. O resultado sai no formato de
+trace-event do Chrome, que abre em chrome://tracing ou no Perfetto.
+Sem profiler, save_cv_data usa NULL_PROFILER e não paga nada.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from build_cache import atomic_write_bytes
+
+class Profiler:
+    """Coleta eventos de etapas; um por processo (ex.: um por CV no batch)"""
+
+    def __init__(self, allocations=True, label=None):
+        self.allocations = allocations
+        self.label = label
+        self.events = []
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name, manifest=None):
+        """Mede o bloco como uma etapa; manifest fornece bytes e cache"""
+        written = len(manifest.written) if manifest else 0
+        skipped = len(manifest.skipped) if manifest else 0
+        bytes_before = manifest.bytes_written if manifest else 0
+        if self.allocations:
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            args = {}
+            if self.allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                args["allocated_bytes"] = current - memory_before
+                args["peak_allocated_bytes"] = peak - memory_before
+            if manifest:
+                args["bytes_written"] = manifest.bytes_written - bytes_before
+                args["cache_misses"] = len(manifest.written) - written
+                args["cache_hits"] = len(manifest.skipped) - skipped
+            self.events.append({
+                "name": name,
+                "cat": self.label or "cv",
+                "ph": "X",
+                "ts": started // 1000,
+                "dur": elapsed // 1000,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": args,
+            })
+
+    def summary(self):
+        """
+        Totais por etapa: {nome: {wall_ms, bytes_written, ...}}. Picos de
+        memória não se somam: peak_allocated_bytes é o maior da etapa.
+        """
+        totals = {}
+        for event in self.events:
+            entry = totals.setdefault(event["name"], {"wall_ms": 0.0})
+            entry["wall_ms"] += event["dur"] / 1000
+            for key, value in event["args"].items():
+                if key == "peak_allocated_bytes":
+                    entry[key] = max(entry.get(key, 0), value)
+                else:
+                    entry[key] = entry.get(key, 0) + value
+        return totals
+
+class _NullProfiler:
+    events = ()
+
+    def stage(self, name, manifest=None):
+        return nullcontext()
+
+NULL_PROFILER = _NullProfiler()
+
+def chrome_trace(events):
+    """
+    Documento trace-event do Chrome. Cada processo recebe o rótulo do seu
+    CV, ou "worker <pid>" quando processou vários (modo batch).
+    """
+    labels = {}
+    for event in events:
+        labels.setdefault(event["pid"], set()).add(event["cat"])
+    metadata = [
+        {
+            "name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+            "args": {"name": next(iter(names)) if len(names) == 1 else f"worker {pid}"},
+        }
+        for pid, names in labels.items()
+    ]
+    return {"traceEvents": metadata + list(events), "displayTimeUnit": "ms"}
+
+def save_trace(path, events):
+    payload = json.dumps(chrome_trace(events), separators=(",", ":")).encode("utf-8")
+    atomic_write_bytes(path, payload)
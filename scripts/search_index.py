@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Índice de busca por idioma.
+
+Para cada idioma monta um índice invertido sobre projetos (título,
+descrição, tecnologias) e experiências (cargo/empresa, descrição,
+tecnologias, highlights). Os termos são normalizados sem acentos, então
+"geolocalizacao" encontra "Geolocalização". O índice vai para
+search/index.<lang>.json (+ .gz/.br) em JSON compacto:
+
+    {"v": 1,
+     "docs": [[tipo, id, título], ...],
+     "terms": ["aws", "brasil", ...],          (ordenados)
+     "postings": [[doc, peso, Δdoc, peso, ...], ...]}
+
+postings[i] são os documentos do termo terms[i], com o índice do
+documento codificado como diferença para o anterior. O i18n.js carrega o
+arquivo só na primeira busca e resolve cada termo com uma consulta.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+from bundles import compressed_variants, minify_json, read_json
+
+SEARCH_DIR = "search"
+INDEX_VERSION = 1
+MIN_TERM_LENGTH = 2
+
+# Peso de cada campo na pontuação
+FIELD_WEIGHTS = {"title": 3, "technologies": 2, "description": 1, "highlights": 1}
+
+_TERM_RE = re.compile(r"[^\W_]+")
+
+def fold(text):
+    """Minúsculas sem acentos (mesma regra de I18n.foldSearchText)"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+def tokenize(text):
+    return [term for term in _TERM_RE.findall(fold(text)) if len(term) >= MIN_TERM_LENGTH]
+
+def search_documents(projects, cv_data):
+    """
+    Documentos indexáveis de um idioma: (tipo, id, título, {campo: textos}).
+    projects é o content/projects.<lang>.json já traduzido.
+    """
+    documents = []
+    for project in projects:
+        documents.append(("project", project["id"], project["title"], {
+            "title": [project["title"]],
+            "description": [project["description"]],
+            "technologies": project["technologies"],
+        }))
+    for index, entry in enumerate(cv_data.experience):
+        title = f"{entry.position} — {entry.company}" if entry.position else entry.company
+        documents.append(("experience", f"experience-{index}", title, {
+            "title": [entry.position, entry.company],
+            "description": [entry.description],
+            "technologies": entry.technologies,
+            "highlights": entry.highlights,
+        }))
+    return documents
+
+def build_index(documents):
+    """Índice invertido compacto (ver docstring do módulo)"""
+    scores = {}
+    for doc_id, (_kind, _id, _title, fields) in enumerate(documents):
+        for field_name, texts in fields.items():
+            weight = FIELD_WEIGHTS[field_name]
+            for text in texts:
+                for term in tokenize(text):
+                    postings = scores.setdefault(term, {})
+                    postings[doc_id] = postings.get(doc_id, 0) + weight
+
+    terms = sorted(scores)
+    packed = []
+    for term in terms:
+        flat = []
+        previous = 0
+        for doc_id, score in sorted(scores[term].items()):
+            flat.extend((doc_id - previous, score))
+            previous = doc_id
+        packed.append(flat)
+    return {
+        "v": INDEX_VERSION,
+        "docs": [[kind, doc_id, title] for kind, doc_id, title, _fields in documents],
+        "terms": terms,
+        "postings": packed,
+    }
+
+def search(index, query):
+    """
+    Busca de referência (a mesma do i18n.js): todos os termos precisam
+    aparecer; o último também vale como prefixo. Retorna [(pontos, doc)].
+    """
+    terms = index["terms"]
+    positions = {term: i for i, term in enumerate(terms)}
+    query_terms = tokenize(query)
+    if not query_terms:
+        return []
+
+    totals = None
+    for n, term in enumerate(query_terms):
+        matches = [positions[term]] if term in positions else []
+        if n == len(query_terms) - 1:
+            # Termos com o prefixo são contíguos na lista ordenada
+            matches = []
+            position = bisect_left(terms, term)
+            while position < len(terms) and terms[position].startswith(term):
+                matches.append(position)
+                position += 1
+        found = {}
+        for position in matches:
+            doc_id = 0
+            postings = index["postings"][position]
+            for i in range(0, len(postings), 2):
+                doc_id += postings[i]
+                found[doc_id] = max(found.get(doc_id, 0), postings[i + 1])
+        totals = found if totals is None else {
+            doc_id: score + found[doc_id] for doc_id, score in totals.items() if doc_id in found
+        }
+    ranked = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+    return [(score, index["docs"][doc_id]) for doc_id, score in ranked]
+
+def update_search_index(manifest, cv_data, locales):
+    """
+    Regera search/index.<lang>.json dos idiomas cujos projetos ou cv_data
+    foram regravados nesta execução (ou cujo índice sumiu).
+    """
+    data_changed = "cv_data.json" in manifest.written
+    for locale in locales:
+        relative_path = f"{SEARCH_DIR}/index.{locale}.json"
+        source = f"content/projects.{locale}.json"
+        if not data_changed and source not in manifest.written and manifest.is_fresh(relative_path):
+            manifest.skipped.append(relative_path)
+            continue
+        projects = read_json(manifest.root / source)
+        if projects is None:
+            continue
+        payload = minify_json(build_index(search_documents(projects, cv_data)))
+        manifest.write(relative_path, payload)
+        for suffix, compressed in compressed_variants(payload).items():
+            manifest.write(relative_path + suffix, compressed)
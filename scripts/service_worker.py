@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Service worker e manifesto de precache.
+
+Última etapa do gerador: lista todos os artefatos do site (arquivos
+gerados pelo manifesto de build mais os CSS/JS/ícones referenciados no
+index.html e as imagens dos projetos) com o hash de cada um em
+precache-manifest.json, e grava sw.js. O service worker serve tudo com
+stale-while-revalidate e, ao instalar uma versão nova, baixa só as
+entradas cujo hash mudou.
+"""
+
+import json
+import re
+
+from build_cache import sha256_bytes, sha256_file
+from bundles import minify_json, read_json
+
+PRECACHE_MANIFEST = "precache-manifest.json"
+SERVICE_WORKER = "sw.js"
+HASH_LENGTH = 10
+
+# Saídas que o navegador nunca pede diretamente
+_EXCLUDED_SUFFIXES = (".gz", ".br", ".tmp")
+_EXCLUDED_FILES = {PRECACHE_MANIFEST, SERVICE_WORKER, ".build-manifest.json"}
+
+_REFERENCE_RE = re.compile(r"""(?:href|src)\s*=\s*["']([^"'#?]+)["']""")
+
+SERVICE_WORKER_SOURCE = """\
+// Gerado por scripts/service_worker.py; não edite à mão
+const VERSION = '%(version)s';
+const CACHE = 'portfolio-precache';
+const MANIFEST_KEY = '__precache-manifest';
+
+const scoped = url => new URL(url, self.registration.scope).href;
+
+async function cachedManifest(cache) {
+    const response = await cache.match(MANIFEST_KEY);
+    return response ? response.json() : {};
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE);
+        const manifest = await fetch('%(manifest)s', { cache: 'no-cache' }).then(res => res.json());
+        const previous = await cachedManifest(cache);
+
+        // Only entries whose hash changed (or are new) are downloaded again
+        const stored = {};
+        const changed = [];
+        for (const [url, hash] of Object.entries(manifest.entries)) {
+            if (previous[url] === hash) stored[url] = hash;
+            else changed.push(url);
+        }
+        // Failed downloads stay out of the stored manifest: the next install retries them
+        await Promise.all(changed.map(async url => {
+            try {
+                const response = await fetch(url, { cache: 'no-cache' });
+                if (!response.ok) return;
+                await cache.put(scoped(url), response);
+                stored[url] = manifest.entries[url];
+            } catch (error) {
+                console.warn(`Precache failed for ${url}:`, error);
+            }
+        }));
+
+        // Remove entries that no longer exist
+        await Promise.all(Object.keys(previous)
+            .filter(url => !(url in manifest.entries))
+            .map(url => cache.delete(scoped(url))));
+
+        await cache.put(MANIFEST_KEY, new Response(JSON.stringify(stored)));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin || url.pathname === '/__livereload') {
+        return;
+    }
+
+    // Stale-while-revalidate: answer from the cache, refresh it in the background
+    event.respondWith((async () => {
+        const cache = await caches.open(CACHE);
+        const cached = await cache.match(request, { ignoreSearch: request.mode === 'navigate' });
+        const network = fetch(request)
+            .then(response => {
+                if (response.ok) cache.put(request, response.clone());
+                return response;
+            })
+            .catch(() => cached);
+
+        if (cached) {
+            event.waitUntil(network);
+            return cached;
+        }
+        return network;
+    })());
+});
+"""
+
+def _is_precached(relative_path):
+    name = relative_path.rsplit("/", 1)[-1]
+    return (
+        relative_path not in _EXCLUDED_FILES
+        and not name.startswith(".")
+        and not relative_path.endswith(_EXCLUDED_SUFFIXES)
+    )
+
+def _page_references(root, pages):
+    """Arquivos locais referenciados (href/src) pelas páginas HTML"""
+    references = set()
+    for page in pages:
+        try:
+            html = (root / page).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        for url in _REFERENCE_RE.findall(html):
+            if ":" in url or url.startswith("//"):
+                continue
+            references.add(url.lstrip("./").lstrip("/"))
+    return references
+
+def _project_images(root):
+    images = set()
+    for path in sorted(root.glob("content/projects.*.json")):
+        for project in read_json(path) or []:
+            images.update(src.lstrip("/") for src in project.get("images", []))
+    return images
+
+def precache_entries(manifest):
+    """{url relativa: hash curto} de todos os artefatos do site"""
+    root = manifest.root
+    entries = {
+        relative: entry["sha256"][:HASH_LENGTH]
+        for relative, entry in manifest.outputs.items()
+        if _is_precached(relative)
+    }
+    pages = ["index.html"] + sorted(path for path in entries if path.endswith(".html"))
+    for relative in _page_references(root, pages) | _project_images(root):
+        if relative in entries or not _is_precached(relative):
+            continue
+        path = root / relative
+        if path.is_file():
+            entries[relative] = sha256_file(path)[:HASH_LENGTH]
+    if (root / "index.html").is_file() and "index.html" not in entries:
+        entries["index.html"] = sha256_file(root / "index.html")[:HASH_LENGTH]
+    return dict(sorted(entries.items()))
+
+def precache_stale(manifest):
+    """
+    Algum artefato mudou desde o último precache-manifest.json? Pega também
+    CSS/JS editados à mão, que o manifesto de build não acompanha.
+    """
+    previous = read_json(manifest.root / PRECACHE_MANIFEST)
+    if not previous or not manifest.is_fresh(PRECACHE_MANIFEST):
+        return True
+    return previous.get("entries") != precache_entries(manifest)
+
+def update_service_worker(manifest):
+    """Grava precache-manifest.json e sw.js (só quando algum hash mudou)"""
+    entries = precache_entries(manifest)
+    version = sha256_bytes(json.dumps(entries, sort_keys=True).encode("utf-8"))[:HASH_LENGTH]
+    manifest.write(PRECACHE_MANIFEST, minify_json({"version": version, "entries": entries}))
+    source = SERVICE_WORKER_SOURCE % {"version": version, "manifest": PRECACHE_MANIFEST}
+    manifest.write(SERVICE_WORKER, source.encode("utf-8"))
+    return entries
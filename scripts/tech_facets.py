@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Facetas de tecnologias pré-calculadas.
+
+As listas `technologies` de experiências e projetos repetem os mesmos
+nomes com grafias diferentes ("Node", "Node.js"; "Postgres",
+"PostgreSQL"). Aqui cada nome é normalizado e internado uma vez, e o
+gerador grava content/technologies.json com, para cada tecnologia: total
+de usos, anos de uso (união dos períodos das experiências, sem contar
+duas vezes empregos simultâneos), categoria de skills e as listas de
+projetos/experiências que a usam, como índices em "projects" e
+"experience". O frontend só precisa ler e desenhar.
+
+"Presente" vale até o mês de referência (asOf no arquivo), nunca o relógio
+no meio da renderização: ele vem de SOURCE_DATE_EPOCH quando definido
+(builds reproduzíveis) e entra na chave do gerador, então o arquivo é
+refeito quando o mês vira.
+"""
+
+import os
+import re
+import sys
+import unicodedata
+from datetime import date, datetime, timezone
+
+FACETS_FILE = "content/technologies.json"
+FACETS_VERSION = 1
+
+# Grafias equivalentes -> nome canônico (chaves já normalizadas por _key)
+TECH_ALIASES = {
+    "node": "Node.js",
+    "nodejs": "Node.js",
+    "postgres": "PostgreSQL",
+    "postgresql": "PostgreSQL",
+    "mysql": "MySQL",
+    "javascript": "JavaScript",
+    "js": "JavaScript",
+    "typescript": "TypeScript",
+    "ts": "TypeScript",
+    "prisma": "Prisma.io",
+    "prismaio": "Prisma.io",
+}
+
+MONTHS = {
+    "jan": 1, "fev": 2, "feb": 2, "mar": 3, "abr": 4, "apr": 4, "mai": 5, "may": 5,
+    "jun": 6, "jul": 7, "ago": 8, "aug": 8, "set": 9, "sep": 9, "out": 10, "oct": 10,
+    "nov": 11, "dez": 12, "dec": 12,
+}
+PRESENT_WORDS = {"presente", "present", "atual", "current", "hoje", "now"}
+
+_DATE_RE = re.compile(r"(?:([a-z]{3})[a-z]*\.?\s+)?(\d{4})")
+_RANGE_SPLIT_RE = re.compile(r"\s*[-–—]\s*|\s+(?:a|to|ate)\s+")
+
+def _fold(text):
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower().strip()
+
+def _key(name):
+    """Chave de comparação: sem acentos, minúsculas, só letras e dígitos"""
+    return re.sub(r"[^a-z0-9+#]", "", _fold(name))
+
+class TechnologyTable:
+    """Interna nomes de tecnologias: um id e um nome canônico por chave"""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def intern(self, name):
+        canonical = TECH_ALIASES.get(_key(name), name.strip())
+        key = _key(canonical)
+        tech_id = self.ids.get(key)
+        if tech_id is None:
+            tech_id = self.ids[key] = len(self.names)
+            self.names.append(sys.intern(canonical))
+        return tech_id
+
+def reference_date():
+    """
+    Mês de referência de "Presente": SOURCE_DATE_EPOCH ou hoje, no dia 1.
+    Levanta ValueError se SOURCE_DATE_EPOCH não é um timestamp Unix.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return date.today().replace(day=1)
+    try:
+        today = datetime.fromtimestamp(int(epoch), timezone.utc).date()
+    except (ValueError, OverflowError, OSError):
+        raise ValueError(
+            f"SOURCE_DATE_EPOCH inválido: {epoch!r} (esperado um timestamp Unix em segundos)"
+        ) from None
+    return today.replace(day=1)
+
+def _month_index(text, today, end=False):
+    """'Mar 2021' -> ano * 12 + mês - 1; 'Presente' -> mês de today; None se não entende"""
+    folded = _fold(text)
+    if folded in PRESENT_WORDS:
+        return today.year * 12 + today.month - 1
+    match = _DATE_RE.search(folded)
+    if not match:
+        return None
+    month = MONTHS.get(match.group(1) or "", 12 if end else 1)
+    return int(match.group(2)) * 12 + month - 1
+
+def parse_period(period, today):
+    """
+    'Jan 2021 - Jul 2025' -> (início, fim) em índices de mês, inclusive.
+    'Presente' vale até o mês de today. None se não entende.
+    """
+    parts = [part for part in _RANGE_SPLIT_RE.split(period.strip()) if part]
+    if not parts:
+        return None
+    start = _month_index(parts[0], today)
+    end = _month_index(parts[1], today, end=True) if len(parts) > 1 else start
+    if start is None or end is None or end < start:
+        return None
+    return start, end
+
+def _merged_months(intervals):
+    """Meses cobertos pela união dos intervalos (inclusive)"""
+    total = 0
+    current = None
+    for start, end in sorted(intervals):
+        if current and start <= current[1] + 1:
+            current[1] = max(current[1], end)
+            continue
+        if current:
+            total += current[1] - current[0] + 1
+        current = [start, end]
+    if current:
+        total += current[1] - current[0] + 1
+    return total
+
+def render_technology_facets(cv_data, today):
+    """Conteúdo de content/technologies.json a partir de cv_data; today é o mês de referência"""
+    table = TechnologyTable()
+    project_postings = {}
+    experience_postings = {}
+    intervals = {}
+
+    projects = cv_data.projects
+    for index, project in enumerate(projects):
+        for name in project.technologies:
+            postings = project_postings.setdefault(table.intern(name), [])
+            if not postings or postings[-1] != index:
+                postings.append(index)
+
+    experience = cv_data.experience
+    for index, entry in enumerate(experience):
+        period = parse_period(entry.period, today)
+        for name in entry.technologies:
+            tech_id = table.intern(name)
+            postings = experience_postings.setdefault(tech_id, [])
+            if not postings or postings[-1] != index:
+                postings.append(index)
+            if period:
+                intervals.setdefault(tech_id, []).append(period)
+
+    # Categoria da seção de skills, quando a tecnologia aparece lá
+    categories = {}
+    for category, names in cv_data.skills.items():
+        for name in names:
+            categories.setdefault(table.intern(name), category)
+
+    facets = []
+    for tech_id, name in enumerate(table.names):
+        used_in_projects = project_postings.get(tech_id, [])
+        used_in_experience = experience_postings.get(tech_id, [])
+        if not used_in_projects and not used_in_experience:
+            continue
+        spans = intervals.get(tech_id, [])
+        facets.append({
+            "name": name,
+            "category": categories.get(tech_id),
+            "count": len(used_in_projects) + len(used_in_experience),
+            "years": round(_merged_months(spans) / 12, 1),
+            "since": min(start for start, _end in spans) // 12 if spans else None,
+            "projects": used_in_projects,
+            "experience": used_in_experience,
+        })
+    facets.sort(key=lambda facet: (-facet["count"], -facet["years"], facet["name"].lower()))
+
+    return {
+        "v": FACETS_VERSION,
+        "asOf": today.strftime("%Y-%m"),
+        "projects": [project.id for project in projects],
+        "experience": [f"experience-{index}" for index in range(len(experience))],
+        "technologies": facets,
+    }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Modo multi-tenant do extract_cv.py (--tenants).
+
+Um template (este repositório) e vários donos de portfólio: cada perfil
+(cv_data.json ou PDF) vira um site completo em <saída>/<nome>/, com os
+arquivos estáticos do template (CSS, JS, imagens) mais os gerados a partir
+do perfil (as páginas saem do index.html do template, com o título, os
+metadados e a URL do perfil). Todos os sites gravam através de um
+ContentStore em <saída>/.store, então um arquivo idêntico em vários sites
+(pacotes de CSS/JS, traduções iguais, imagens) ocupa o disco uma vez e é
+processado uma vez por processo (minificação, compressão e imagens são
+memoizadas pelo hash do conteúdo).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from build_cache import sha256_bytes
+from images import SOURCE_ROOT
+
+STORE_DIR = ".store"
+PROFILE_SUFFIXES = (".json", ".pdf")
+
+# Arquivos do template copiados (por hard link) para cada site
+SITE_FILES = (
+    "site.webmanifest",
+    "robots.txt",
+    "favicon*",
+    "apple-touch-icon*.png",
+    "android-chrome-*.png",
+    "styles/*.css",
+    "scripts/*.js",
+    "images/*.*",
+    "projects/*.*",
+)
+
+def _is_site_file(path):
+    # Pacotes gerados para o site do próprio repositório não são template
+    return path.is_file() and path.suffix != ".md" and not path.name.startswith("bundle.")
+
+@lru_cache(maxsize=None)
+def site_files(root=SOURCE_ROOT):
+    """Caminhos relativos dos arquivos estáticos do template"""
+    found = {
+        path.relative_to(root).as_posix()
+        for pattern in SITE_FILES
+        for path in root.glob(pattern)
+        if _is_site_file(path)
+    }
+    return tuple(sorted(found))
+
+@lru_cache(maxsize=None)
+def _read(path):
+    """Conteúdo e hash de um arquivo do template, lidos uma vez por processo"""
+    payload = Path(path).read_bytes()
+    return payload, sha256_bytes(payload)
+
+def _site_sources(pdf_path):
+    files = {relative: SOURCE_ROOT / relative for relative in site_files()}
+    if pdf_path is not None and Path(pdf_path).suffix == ".pdf":
+        files["cv.pdf"] = Path(pdf_path)
+    return files
+
+def site_assets_stale(manifest, pdf_path=None):
+    """Algum arquivo do template mudou, sumiu do site ou saiu do template?"""
+    files = _site_sources(pdf_path)
+    for relative, source in files.items():
+        if manifest.inputs.get(f"site:{relative}") != _read(source)[1]:
+            return True
+        if not manifest.is_fresh(relative):
+            return True
+    return any(name.startswith("site:") and name.partition(":")[2] not in files for name in manifest.inputs)
+
+def copy_site_assets(manifest, pdf_path=None):
+    """
+    Coloca os arquivos do template no site de manifest.root (e o PDF do
+    perfil como cv.pdf). Só grava o que mudou no template desde a última
+    execução.
+    """
+    files = _site_sources(pdf_path)
+    for relative, source in files.items():
+        payload, digest = _read(source)
+        changed = manifest.track_input(f"site:{relative}", digest)
+        if changed or not manifest.is_fresh(relative):
+            manifest.write(relative, payload)
+        else:
+            manifest.skipped.append(relative)
+
+    # Arquivos que saíram do template
+    for name in list(manifest.inputs):
+        relative = name.partition(":")[2]
+        if name.startswith("site:") and relative not in files:
+            del manifest.inputs[name]
+            manifest.remove(relative)
+
+def collect_tenant_jobs(inputs, output):
+    """
+    Pares (perfil, site) do modo multi-tenant: inputs aceita perfis
+    (.json/.pdf) e pastas com perfis; cada um vai para output/<nome>/.
+    """
+    profiles = []
+    for item in map(Path, inputs):
+        if item.is_dir():
+            profiles.extend(sorted(path for path in item.iterdir() if path.suffix in PROFILE_SUFFIXES))
+        else:
+            profiles.append(item)
+    names = [profile.stem for profile in profiles]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"perfis com o mesmo nome: {', '.join(duplicates)}")
+    if STORE_DIR in names:
+        raise ValueError(f"{STORE_DIR} é reservado para o armazenamento compartilhado")
+    return [(profile, Path(output) / profile.stem) for profile in profiles]
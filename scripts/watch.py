@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Modo --watch do extract_cv.py.
+
+Mantém o CV validado e os templates compilados na memória e observa o
+cv.pdf e o cv_data.json gerado (por polling do mtime/tamanho, que custa
+uma chamada stat por arquivo). Quando um deles muda, só o diff contra o
+modelo em memória é renderizado de novo e o servidor de desenvolvimento
+(dev_server) recebe a lista de arquivos regravados para o live reload.
+
+Tudo é gravado em uma pasta de prévia (.preview), fora dos arquivos
+versionados do repositório. Editar o cv_data.json da prévia à mão também
+vale: o conteúdo dele passa a ser a fonte até o PDF mudar de novo.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from build_cache import BuildManifest
+from cv_model import CVData, CVValidationError
+from dependency_graph import diff_paths
+from extract_cv import CV_PDF, emit_outputs, extract_raw_cv_info, pdf_input_key, save_cv_data
+from json_stream import DEFAULT_FORMAT
+
+POLL_INTERVAL = 0.1
+# Saída do modo --watch (ignorada pelo git)
+PREVIEW_ROOT = ".preview"
+
+def _signature(path):
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class CVWatcher:
+    """Estado mantido entre as regenerações: manifesto e modelo atual"""
+
+    def __init__(self, pdf_path=CV_PDF, output_root=PREVIEW_ROOT, output_format=DEFAULT_FORMAT, notify=None):
+        self.pdf_path = Path(pdf_path)
+        self.output_root = Path(output_root)
+        self.output_format = output_format
+        self.notify = notify
+        self.data_path = self.output_root / "cv_data.json"
+
+        # Primeira passada normal (com cache); depois tudo fica na memória
+        save_cv_data(self.pdf_path, self.output_root, verbose=False, output_format=output_format)
+        self.manifest = BuildManifest.load(self.output_root)
+        with open(self.data_path, encoding="utf-8") as f:
+            self.cv_data = CVData.from_dict(json.load(f))
+        self.snapshot = self.cv_data.to_dict()
+        self.signatures = {path: _signature(path) for path in (self.pdf_path, self.data_path)}
+
+    def poll(self):
+        """Verifica os arquivos uma vez; retorna os arquivos regravados"""
+        changed = [path for path, old in self.signatures.items() if _signature(path) != old]
+        if not changed:
+            return []
+        started = time.perf_counter()
+        # Espera a gravação do editor terminar (assinatura estável)
+        time.sleep(POLL_INTERVAL)
+        for path in changed:
+            self.signatures[path] = _signature(path)
+
+        if self.pdf_path in changed:
+            raw_data = extract_raw_cv_info(self.pdf_path)
+        elif not self.manifest.is_fresh("cv_data.json"):
+            # Edição manual do cv_data.json (a nossa gravação fica no manifesto)
+            try:
+                with open(self.data_path, encoding="utf-8") as f:
+                    raw_data = json.load(f)
+            except (OSError, ValueError) as error:
+                print(f"⚠️  cv_data.json ilegível: {error}")
+                return []
+        else:
+            return []
+        return self.regenerate(raw_data, started)
+
+    def regenerate(self, raw_data, started=None):
+        """Valida, renderiza o diff contra o modelo atual e avisa o servidor"""
+        started = started or time.perf_counter()
+        try:
+            cv_data = CVData.from_dict(raw_data)
+        except CVValidationError as error:
+            print("❌ CV inválido, arquivos mantidos:")
+            for message in error.errors:
+                print(f"   - {message}")
+            return []
+
+        snapshot = cv_data.to_dict()
+        changed = diff_paths(self.snapshot, snapshot)
+        manifest = self.manifest
+        manifest.written, manifest.skipped, manifest.removed = [], [], []
+        emit_outputs(cv_data, manifest, changed, output_format=self.output_format)
+        manifest.input_key = pdf_input_key(self.pdf_path)
+        manifest.save()
+        self.cv_data, self.snapshot = cv_data, snapshot
+        self.signatures[self.data_path] = _signature(self.data_path)
+
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"🔄 {len(changed)} campo(s) alterado(s), {len(manifest.written)} arquivo(s) regravado(s) em {elapsed:.0f} ms")
+        for relative_path in manifest.written:
+            print(f"   - {relative_path} (atualizado)")
+        for relative_path in manifest.removed:
+            print(f"   - {relative_path} (removido)")
+        written = manifest.written + manifest.removed
+        if written and self.notify:
+            self.notify(written)
+        return written
+
+    def run(self):
+        print(f"👀 Observando {self.pdf_path} e {self.data_path} (Ctrl+C para sair)")
+        try:
+            while True:
+                self.poll()
+                time.sleep(POLL_INTERVAL)
+        except KeyboardInterrupt:
+            print("👋 Watch encerrado")
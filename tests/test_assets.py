@@ -0,0 +1,72 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from assets import minify_css, minify_js
+
+SCRIPTS = sorted((Path(__file__).resolve().parent.parent / "scripts").glob("*.js"))
+
+needs_node = pytest.mark.skipif(shutil.which("node") is None, reason="node não instalado")
+
+def _node(source, tmp_path, name="snippet.js", check=False):
+    path = tmp_path / name
+    path.write_text(source, encoding="utf-8")
+    command = ["node", "--check", str(path)] if check else ["node", str(path)]
+    return subprocess.run(command, capture_output=True, text=True, check=True).stdout
+
+def test_css_strips_comments_and_whitespace():
+    css = "a {\n  color: red; /* nota */\n  margin: 0 ;\n}\n\nb > i , u { top: 1px; }"
+    assert minify_css(css) == "a{color:red;margin:0}b>i,u{top:1px}"
+
+def test_css_keeps_strings_and_urls_intact():
+    css = (
+        'a::before { content: "x ;} /* y */ "; }\n'
+        "b { background: url(data:image/svg+xml;utf8,<svg>;}</svg>); }\n"
+        "i { font-family: 'A  B' ; }"
+    )
+    assert minify_css(css) == (
+        'a::before{content:"x ;} /* y */ "}'
+        "b{background:url(data:image/svg+xml;utf8,<svg>;}</svg>)}"
+        "i{font-family:'A  B'}"
+    )
+
+JS_SNIPPET = r"""
+// comentário de linha
+const url = "http://example.com/*não é comentário*/";
+const path = 'a // b';
+/* bloco
+   de várias linhas */
+const slash = /[/]+\/x/g;
+const ratio = 10 / 2 / 5;
+let a = 1
+let b = a
+++b
+const tpl = `x ${ { k: `y ${a + b}` }.k } z // ainda template`;
+function f() {
+    return (
+        a + b
+    )
+}
+function g() {
+    return
+    42
+}
+const list = [1, 2, 3]
+    .map(n => n * 2)
+    .filter(n => n > 2);
+console.log(JSON.stringify([url, path, "a/b//c".replace(slash, "-"), ratio, a, b, tpl, f(), g(), list]));
+"""
+
+@needs_node
+def test_js_minified_behaves_the_same(tmp_path):
+    minified = minify_js(JS_SNIPPET)
+    assert "comentário de linha" not in minified and "bloco" not in minified
+    assert len(minified) < len(JS_SNIPPET)
+    assert _node(minified, tmp_path, "min.js") == _node(JS_SNIPPET, tmp_path)
+
+@needs_node
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda path: path.name)
+def test_minified_site_scripts_parse(script, tmp_path):
+    _node(minify_js(script.read_text(encoding="utf-8")), tmp_path, script.name, check=True)
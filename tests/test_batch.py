@@ -0,0 +1,17 @@
+import pytest
+
+from extract_cv import collect_batch_jobs
+
+def test_batch_jobs_use_the_pdf_name(tmp_path):
+    (tmp_path / "cvs").mkdir()
+    for name in ("ana.pdf", "bruno.pdf"):
+        (tmp_path / "cvs" / name).write_bytes(b"")
+    jobs = collect_batch_jobs([tmp_path / "cvs"], [tmp_path / "sites"])
+    assert [output.name for _pdf, output in jobs] == ["ana", "bruno"]
+
+def test_batch_jobs_reject_duplicate_names(tmp_path):
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "cv.pdf").write_bytes(b"")
+    with pytest.raises(ValueError, match="cv"):
+        collect_batch_jobs([tmp_path / "a", tmp_path / "b"], [tmp_path / "sites"])
@@ -0,0 +1,39 @@
+import os
+
+from build_cache import BuildManifest, ContentStore, LRUCache
+
+def _sites(tmp_path):
+    store = ContentStore(tmp_path / ".store")
+    sites = []
+    for name in ("a", "b"):
+        manifest = BuildManifest(tmp_path / name)
+        manifest.store = store
+        sites.append(manifest)
+    return sites
+
+def test_write_hard_links_identical_files_across_tenants(tmp_path):
+    first, second = _sites(tmp_path)
+    first.write("styles/site.css", b"a{color:red}")
+    second.write("styles/site.css", b"a{color:red}")
+    path = tmp_path / "a" / "styles/site.css"
+    assert os.path.samefile(path, tmp_path / "b" / "styles/site.css")
+    assert path.stat().st_nlink == 3
+
+def test_write_stream_hard_links_when_content_is_already_stored(tmp_path):
+    first, second = _sites(tmp_path)
+    first.write_stream("cv_data.json", iter([b'{"a":', b"1}"]))
+    second.write_stream("cv_data.json", iter([b'{"a":', b"1}"]))
+    path = tmp_path / "b" / "cv_data.json"
+    assert os.path.samefile(tmp_path / "a" / "cv_data.json", path)
+    assert path.stat().st_nlink == 3
+    assert path.read_bytes() == b'{"a":1}'
+    assert not [leftover for leftover in path.parent.iterdir() if leftover.name.endswith((".tmp", ".link"))]
+
+def test_lru_cache_drops_the_least_recently_used_entry():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c"), len(cache)) == (1, 3, 2)
@@ -0,0 +1,30 @@
+import pickle
+
+import pytest
+
+from cv_model import CVData, CVValidationError, lookup
+from dependency_graph import DependencyTracker
+
+def test_validation_error_survives_pickling():
+    with pytest.raises(CVValidationError) as caught:
+        CVData.from_dict({"personal_info": {}})
+    error = pickle.loads(pickle.dumps(caught.value))
+    assert isinstance(error, CVValidationError)
+    assert error.errors == caught.value.errors
+    assert str(error) == str(caught.value)
+
+def test_lookup_records_only_the_paths_it_reads():
+    cv_data = CVData.from_dict({
+        "personal_info": {"name": "Ana"},
+        "experience": [{"company": "A", "position": "Dev"}],
+        "skills": {"Frontend": ["React"]},
+    })
+    tracker = DependencyTracker(cv_data)
+    assert lookup(tracker.root, ("personal_info", "name")) == "Ana"
+    assert lookup(tracker.root, ("experience", 0, "company")) == "A"
+    assert lookup(tracker.root, ("skills", "Frontend", 0)) == "React"
+    assert tracker.paths == {
+        ("personal_info", "name"),
+        ("experience", 0, "company"),
+        ("skills", "Frontend", 0),
+    }
@@ -0,0 +1,65 @@
+import zlib
+from pathlib import Path
+
+import pytest
+
+from cv_pdf import PDFError, iter_text_blocks
+
+CV_PDF = Path(__file__).resolve().parent.parent / "cv.pdf"
+
+def _pdf(content, stream_dict=b"", raw=None):
+    """PDF mínimo de uma página com o fluxo de conteúdo dado"""
+    body = raw if raw is not None else content
+    return (
+        b"%PDF-1.4\n"
+        b"1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n"
+        b"2 0 obj << /Type /Pages /Kids [3 0 R] >> endobj\n"
+        b"3 0 obj << /Type /Page /Contents 4 0 R >> endobj\n"
+        b"4 0 obj << /Length " + str(len(body)).encode() + stream_dict + b" >> stream\n"
+        + body + b"\nendstream endobj\n"
+        b"trailer << /Root 1 0 R >>\n"
+    )
+
+def _blocks(tmp_path, data):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(data)
+    return list(iter_text_blocks(path))
+
+def test_reads_plain_and_flate_streams(tmp_path):
+    assert _blocks(tmp_path, _pdf(b"BT (Ana) Tj ET")) == [(1, "P", "Ana")]
+    compressed = zlib.compress(b"BT (Bruno) Tj ET")
+    assert _blocks(tmp_path, _pdf(None, b" /Filter /FlateDecode", compressed)) == [(1, "P", "Bruno")]
+
+def test_non_octal_escape_is_the_literal_character(tmp_path):
+    assert _blocks(tmp_path, _pdf(rb"BT (a\8b\9c\101) Tj ET")) == [(1, "P", "a8b9cA")]
+
+def test_corrupt_flate_stream(tmp_path):
+    data = _pdf(None, b" /Filter /FlateDecode", b"isto nao e zlib")
+    with pytest.raises(PDFError):
+        _blocks(tmp_path, data)
+
+def test_garbage_startxref(tmp_path):
+    with pytest.raises(PDFError):
+        _blocks(tmp_path, b"%PDF-1.4\nstartxref\nabc\n%%EOF")
+
+def test_empty_file(tmp_path):
+    with pytest.raises(PDFError):
+        _blocks(tmp_path, b"")
+
+@pytest.mark.parametrize("fraction", [0.1, 0.25, 0.5, 0.75, 0.9, 0.99])
+def test_truncated_pdf_reads_or_raises_pdf_error(tmp_path, fraction):
+    data = CV_PDF.read_bytes()
+    try:
+        _blocks(tmp_path, data[:int(len(data) * fraction)])
+    except PDFError:
+        pass
+
+def test_corrupted_bytes_read_or_raise_pdf_error(tmp_path):
+    data = bytearray(CV_PDF.read_bytes())
+    for position in range(97, len(data), len(data) // 40):
+        corrupt = bytearray(data)
+        corrupt[position:position + 8] = b"\xff]>>(R/0"
+        try:
+            _blocks(tmp_path, bytes(corrupt))
+        except PDFError:
+            pass
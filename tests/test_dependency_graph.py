@@ -0,0 +1,59 @@
+from build_cache import BuildManifest
+from dependency_graph import diff_paths, is_affected
+from extract_cv import _render_output
+
+def test_diff_paths_reports_changed_leaves_and_list_growth():
+    old = {"personal_info": {"name": "Ana"}, "experience": [{"company": "A"}], "skills": {"Frontend": ["React"]}}
+    new = {"personal_info": {"name": "Ana B."}, "experience": [{"company": "A"}, {"company": "B"}], "awards": []}
+    assert diff_paths(old, new) == {
+        ("personal_info", "name"),
+        ("experience", 1),
+        ("skills",),
+        ("awards",),
+    }
+    assert diff_paths(old, old) == set()
+
+def test_is_affected_matches_prefixes_both_ways():
+    # Quem iterou a lista depende de qualquer item dela
+    assert is_affected({("experience",)}, {("experience", 2, "company")})
+    # Quem leu um campo depende da troca da seção inteira
+    assert is_affected({("personal_info", "name")}, {("personal_info",)})
+    assert not is_affected({("personal_info", "name")}, {("personal_info", "email"), ("experience", 0)})
+    assert not is_affected(set(), {("experience",)})
+
+def test_needs_render_without_diff_or_dependencies(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    manifest.write("out.json", b"{}")
+    assert manifest.needs_render("out.json", None)
+    assert manifest.needs_render("out.json", set())
+    manifest.dependencies["out.json"] = {("personal_info", "name")}
+    assert not manifest.needs_render("out.json", {("experience", 0)})
+    assert manifest.needs_render("out.json", {("personal_info", "name")})
+
+def test_needs_render_when_the_output_was_edited(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    manifest.write("out.json", b"{}")
+    manifest.dependencies["out.json"] = {("personal_info", "name")}
+    (tmp_path / "out.json").write_bytes(b'{"edited": true}')
+    assert manifest.needs_render("out.json", set())
+
+def test_render_is_skipped_when_no_dependency_changed(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    calls = []
+
+    def render(cv_data):
+        calls.append(cv_data)
+        return {"name": cv_data["personal_info"]["name"]}
+
+    data = {"personal_info": {"name": "Ana", "email": "ana@example.com"}}
+    assert _render_output(manifest, "out.json", render, data)
+    assert manifest.dependencies["out.json"] == {("personal_info", "name")}
+
+    assert not _render_output(manifest, "out.json", render, data, changed={("personal_info", "email")})
+    assert len(calls) == 1
+    assert manifest.skipped == ["out.json"]
+
+    data["personal_info"]["name"] = "Ana B."
+    assert _render_output(manifest, "out.json", render, data, changed={("personal_info", "name")})
+    assert len(calls) == 2
+    assert (tmp_path / "out.json").read_text(encoding="utf-8") == '{\n  "name": "Ana B."\n}'
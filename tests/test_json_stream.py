@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from cv_model import CVData
+from json_stream import OUTPUT_FORMATS, iter_json
+
+DATA = {
+    "personal_info": {"name": "Ana Souza", "headline": "Engenheira \"de\" Dados", "website": ""},
+    "experience": [
+        {"company": "Ação", "position": "Dev", "highlights": ["a\nb", "c"], "technologies": []},
+        {"company": "B", "position": "Lead", "highlights": [], "technologies": ["React", "Node"]},
+    ],
+    "skills": {"Frontend": ["React"], "Backend": []},
+    "projects": [],
+    "languages": [{"name": "Português", "level": "Nativo"}],
+}
+
+OPTIONS = {
+    "pretty": {"ensure_ascii": False, "indent": 2},
+    "compact": {"ensure_ascii": False, "separators": (",", ":")},
+    "minified": {"ensure_ascii": False, "separators": (",", ":"), "sort_keys": True},
+}
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+def test_iter_json_matches_json_dumps(output_format):
+    expected = json.dumps(DATA, **OPTIONS[output_format])
+    assert "".join(iter_json(DATA, output_format)) == expected
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+def test_iter_json_matches_json_dumps_for_records_and_generators(output_format):
+    cv_data = CVData.from_dict(DATA)
+    expected = json.dumps(cv_data.to_dict(), **OPTIONS[output_format])
+    assert "".join(iter_json(cv_data, output_format)) == expected
+
+    items = [{"id": index, "tags": ["x"] * index} for index in range(3)]
+    generated = (item for item in items)
+    assert "".join(iter_json({"items": generated}, output_format)) == json.dumps({"items": items}, **OPTIONS[output_format])
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+def test_iter_json_empty_containers(output_format):
+    for value in ({}, [], {"a": {}, "b": []}):
+        assert "".join(iter_json(value, output_format)) == json.dumps(value, **OPTIONS[output_format])
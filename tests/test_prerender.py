@@ -0,0 +1,77 @@
+from prerender import compile_page, render_pages, with_profile_meta
+
+TEMPLATE = """<html lang="pt-BR"><body>
+<div class="hero__avatar"><img src="images/profile.jpg" alt="A" class="hero__image" sizes="200px"></div>
+<h1 data-i18n="hero.title">Olá</h1>
+</body></html>"""
+
+MEDIA = {
+    "images/profile.jpg": {
+        "src": "images/profile.jpg",
+        "width": 400,
+        "height": 400,
+        "srcset": {"image/webp": "images/optimized/images-profile-320.webp 320w, images/optimized/images-profile-400.webp 400w"},
+    },
+}
+
+def _render(html, media):
+    pages = {"index.html": ("en-US", {}, {"hero": {"title": "Hi"}}, [])}
+    return render_pages(compile_page(html), pages, media)["index.html"]
+
+def test_profile_image_becomes_picture_with_relative_srcset():
+    html = _render(TEMPLATE, MEDIA)
+    assert '<picture><source type="image/webp" srcset="images/optimized/' in html
+    assert 'sizes="200px"' in html
+    assert 'width="400" height="400"' in html
+    assert "/images/" not in html
+
+def test_img_stays_without_variants():
+    html = _render(TEMPLATE, {})
+    assert "<picture" not in html
+    assert '<img src="images/profile.jpg" alt="A" class="hero__image" sizes="200px">' in html
+
+def test_text_keeps_icons_and_layout():
+    html = """<html lang="pt-BR"><body>
+<a href="cv.pdf" data-i18n="hero.title">
+    <svg width="20"><path d="M1 1"></path></svg>
+    Olá
+</a>
+<p data-i18n="hero.same">
+    Hi
+    there
+</p>
+</body></html>"""
+    pages = {"index.html": ("en-US", {}, {"hero": {"title": "Hi & bye", "same": "Hi there"}}, [])}
+    rendered = render_pages(compile_page(html), pages)["index.html"]
+    assert '<svg width="20"><path d="M1 1"></path></svg>\n    Hi &amp; bye\n</a>' in rendered
+    assert "<p data-i18n=\"hero.same\">\n    Hi\n    there\n</p>" in rendered
+
+def test_empty_translation_renders_empty():
+    pages = {"index.html": ("en-US", {}, {"hero": {"title": ""}}, [])}
+    rendered = render_pages(compile_page(TEMPLATE), pages)["index.html"]
+    assert '<h1 data-i18n="hero.title"></h1>' in rendered
+
+HEAD = """<html lang="pt-BR"><head>
+    <meta name="author" content="Dono">
+    <meta property="og:url" content="https://dono.dev/site/">
+    <meta property="og:title" content="Dono - Dev">
+    <meta property="og:image"
+        content="https://dono.dev/site/images/profile.jpg">
+    <link rel="alternate" hreflang="x-default" href="https://dono.dev/site/">
+</head></html>"""
+
+TRANSLATIONS = {"hero": {"name": "Ana", "headline": "Dados", "description": "Resumo"}}
+
+def test_profile_meta_uses_the_profile_url():
+    html = with_profile_meta(HEAD, TRANSLATIONS, "https://ana.dev/")
+    assert '<meta name="author" content="Ana">' in html
+    assert '<meta property="og:title" content="Ana - Dados">' in html
+    assert 'content="https://ana.dev/images/profile.jpg"' in html
+    assert '<meta property="og:url" content="https://ana.dev/">' in html
+    assert 'content="https://dono' not in html
+
+def test_profile_meta_without_url_drops_absolute_links():
+    html = with_profile_meta(HEAD, TRANSLATIONS, "")
+    assert "og:url" not in html and "og:image" not in html
+    assert "hreflang" not in html
+    assert "dono" not in html.lower()
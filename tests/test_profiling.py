@@ -0,0 +1,12 @@
+from profiling import Profiler
+
+def test_summary_reports_max_peak_per_stage():
+    profiler = Profiler(allocations=False, label="cv")
+    profiler.events = [
+        {"name": "write", "dur": 1000, "args": {"peak_allocated_bytes": 300, "bytes_written": 10}},
+        {"name": "write", "dur": 3000, "args": {"peak_allocated_bytes": 500, "bytes_written": 5}},
+    ]
+    totals = profiler.summary()["write"]
+    assert totals["peak_allocated_bytes"] == 500
+    assert totals["bytes_written"] == 15
+    assert totals["wall_ms"] == 4.0
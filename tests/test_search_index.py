@@ -0,0 +1,73 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from search_index import build_index, search
+
+I18N_JS = Path(__file__).resolve().parent.parent / "scripts" / "i18n.js"
+
+DOCUMENTS = [
+    ("project", "getap", "GETAP", {
+        "title": ["GETAP"],
+        "description": ["Plataforma de geolocalização para gestão de equipes"],
+        "technologies": ["React", "Node.js", "PostgreSQL"],
+    }),
+    ("project", "aprender", "Aprender", {
+        "title": ["Aprender e Capacitar"],
+        "description": ["Ensino a distância com React Native"],
+        "technologies": ["React Native", "TypeScript"],
+    }),
+    ("experience", "experience-0", "Senior Developer — Volvo", {
+        "title": ["Senior Developer", "Volvo"],
+        "description": ["Aplicações web e mobile em React e TypeScript"],
+        "technologies": ["React", "TypeScript", "AWS"],
+        "highlights": ["Migração para AWS", "Geolocalização em tempo real"],
+    }),
+]
+
+QUERIES = [
+    "react", "re", "React Native", "typescript rea", "geolocalizacao", "GEOLOCALIZAÇÃO",
+    "aws migra", "volvo", "nada", "", "a", "node js", "ensino dist", "capacitar aprender",
+]
+
+# Roda I18n.prototype.search do i18n.js com um índice já carregado
+NODE_SCRIPT = """
+const vm = require('vm');
+const fs = require('fs');
+const [source, indexJson, queriesJson] = process.argv.slice(1).map(arg => fs.readFileSync(arg, 'utf8'));
+const noop = () => {};
+const context = vm.createContext({ document: { addEventListener: noop }, window: { addEventListener: noop } });
+const I18n = vm.runInContext(source + '\\n;I18n', context);
+const index = JSON.parse(indexJson);
+const i18n = Object.create(I18n.prototype);
+i18n.searchIndexes = { en: Promise.resolve({ ...index, positions: new Map(index.terms.map((term, i) => [term, i])) }) };
+Promise.all(JSON.parse(queriesJson).map(query => i18n.search(query, 'en')))
+    .then(results => console.log(JSON.stringify(results)));
+"""
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node não instalado")
+def test_search_matches_i18n_js(tmp_path):
+    index = build_index(DOCUMENTS)
+    (tmp_path / "index.json").write_text(json.dumps(index), encoding="utf-8")
+    (tmp_path / "queries.json").write_text(json.dumps(QUERIES), encoding="utf-8")
+    result = subprocess.run(
+        ["node", "-e", NODE_SCRIPT, str(I18N_JS), str(tmp_path / "index.json"), str(tmp_path / "queries.json")],
+        capture_output=True, text=True, check=True,
+    )
+    from_js = json.loads(result.stdout)
+
+    for query, js_results in zip(QUERIES, from_js):
+        expected = [
+            {"type": kind, "id": doc_id, "title": title, "score": score}
+            for score, (kind, doc_id, title) in search(index, query)
+        ]
+        assert js_results == expected, query
+
+def test_search_folds_accents_and_uses_last_term_as_prefix():
+    index = build_index(DOCUMENTS)
+    assert [doc[1] for _score, doc in search(index, "geolocalizacao")] == ["getap", "experience-0"]
+    assert [doc[1] for _score, doc in search(index, "typescript rea")] == ["experience-0", "aprender"]
+    assert search(index, "a") == []
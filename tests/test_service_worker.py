@@ -0,0 +1,59 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from service_worker import PRECACHE_MANIFEST, SERVICE_WORKER_SOURCE
+
+needs_node = pytest.mark.skipif(shutil.which("node") is None, reason="node não instalado")
+
+# Instala o sw.js com fetch/caches falsos e imprime o manifesto guardado
+HARNESS = """
+const entries = %(entries)s;
+const previous = %(previous)s;
+const listeners = {};
+const store = new Map([['__precache-manifest', JSON.stringify(previous)]]);
+globalThis.self = {
+    registration: { scope: 'https://site.test/' },
+    location: { origin: 'https://site.test' },
+    addEventListener: (type, listener) => { listeners[type] = listener; },
+    skipWaiting: async () => {},
+};
+globalThis.caches = {
+    open: async () => ({
+        match: async key => store.has(key) ? { json: async () => JSON.parse(store.get(key)) } : undefined,
+        put: async (key, response) => { store.set(key, await response.text()); },
+        delete: async key => store.delete(key),
+    }),
+};
+globalThis.fetch = async url => {
+    if (url === '%(manifest)s') return { json: async () => ({ entries }) };
+    if (url === 'missing.css') return { ok: false, text: async () => '' };
+    if (url === 'offline.js') throw new Error('offline');
+    return { ok: true, text: async () => 'body of ' + url };
+};
+console.warn = () => {};
+%(source)s
+let installing;
+listeners.install({ waitUntil: promise => { installing = promise; } });
+installing.then(() => console.log(store.get('__precache-manifest')));
+"""
+
+def _install(tmp_path, entries, previous):
+    source = SERVICE_WORKER_SOURCE % {"version": "test", "manifest": PRECACHE_MANIFEST}
+    path = tmp_path / "install.js"
+    path.write_text(HARNESS % {
+        "entries": json.dumps(entries),
+        "previous": json.dumps(previous),
+        "manifest": PRECACHE_MANIFEST,
+        "source": source,
+    }, encoding="utf-8")
+    output = subprocess.run(["node", str(path)], capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+@needs_node
+def test_install_stores_only_the_entries_it_cached(tmp_path):
+    entries = {"index.html": "new", "kept.css": "same", "missing.css": "new", "offline.js": "new"}
+    previous = {"index.html": "old", "kept.css": "same", "missing.css": "old", "gone.js": "old"}
+    assert _install(tmp_path, entries, previous) == {"index.html": "new", "kept.css": "same"}
@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+from cv_model import CVData
+from tech_facets import parse_period, reference_date, render_technology_facets
+
+CV = {
+    "personal_info": {"name": "A"},
+    "experience": [
+        {"company": "X", "position": "Dev", "period": "Jan 2020 - Presente", "technologies": ["React"]},
+        {"company": "Y", "position": "Dev", "period": "Jun 2019 - Dez 2019", "technologies": ["Node"]},
+    ],
+}
+
+def test_present_uses_the_reference_month():
+    assert parse_period("Jan 2020 - Presente", date(2020, 12, 1)) == (2020 * 12, 2020 * 12 + 11)
+
+def test_facets_are_reproducible_for_a_reference_date():
+    cv_data = CVData.from_dict(CV)
+    first = render_technology_facets(cv_data, date(2021, 1, 1))
+    assert first == render_technology_facets(cv_data, date(2021, 1, 1))
+    assert first["asOf"] == "2021-01"
+    assert {facet["name"]: facet["years"] for facet in first["technologies"]} == {"React": 1.1, "Node.js": 0.6}
+
+def test_reference_date_honors_source_date_epoch(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    assert reference_date() == date(2023, 11, 1)
+
+@pytest.mark.parametrize("epoch", ["amanhã", "1.7e9", "99999999999999999999"])
+def test_reference_date_rejects_invalid_source_date_epoch(monkeypatch, epoch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", epoch)
+    with pytest.raises(ValueError, match="SOURCE_DATE_EPOCH inválido"):
+        reference_date()